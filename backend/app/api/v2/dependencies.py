@@ -134,6 +134,8 @@ def get_document_processing_service() -> DocumentProcessingService:
         extraction_llm_enabled=settings.extraction_llm_enabled,
         extraction_llm_model=settings.gemini_model,
         extraction_mode=settings.extraction_mode,
+        extraction_page_concurrency=settings.llm_page_concurrency,
+        extraction_pages_per_call=settings.llm_pages_per_call,
     )
 
 
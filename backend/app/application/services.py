@@ -93,6 +93,8 @@ class DocumentProcessingService:
         extraction_llm_enabled: bool = True,
         extraction_llm_model: str | None = None,
         extraction_mode: str = "hybrid",
+        extraction_page_concurrency: int = 8,
+        extraction_pages_per_call: int = 1,
     ):
         self.store = store
         self.ocr = ocr
@@ -104,6 +106,8 @@ class DocumentProcessingService:
             llm_enabled=extraction_llm_enabled,
             llm_model=extraction_llm_model,
             extraction_mode=extraction_mode,
+            page_concurrency=extraction_page_concurrency,
+            pages_per_call=extraction_pages_per_call,
         )
         self.cropper = QuestionCropper(storage=storage, ocr_lang=ocr_lang, secondary_ocr=ocr)
         self.stage_delay_seconds = max(0.0, stage_delay_ms / 1000.0)
@@ -66,6 +66,8 @@ class Settings:
     gemini_model: str
     llm_timeout_seconds: int
     llm_max_retries: int
+    llm_page_concurrency: int
+    llm_pages_per_call: int
     ocr_lang: str
     extraction_llm_enabled: bool
     extraction_mode: str
@@ -84,6 +86,8 @@ def get_settings() -> Settings:
     llm_backend = os.getenv("SEDU_LLM_BACKEND", "mock").lower()
     llm_timeout_seconds = _parse_non_negative_int(os.getenv("SEDU_LLM_TIMEOUT_SECONDS"), default=90) or 90
     llm_max_retries = _parse_non_negative_int(os.getenv("SEDU_LLM_MAX_RETRIES"), default=1)
+    llm_page_concurrency = _parse_non_negative_int(os.getenv("SEDU_LLM_PAGE_CONCURRENCY"), default=8) or 8
+    llm_pages_per_call = _parse_non_negative_int(os.getenv("SEDU_LLM_PAGES_PER_CALL"), default=1) or 1
     ocr_lang = os.getenv("SEDU_OCR_LANG", "kor+eng").strip() or "kor+eng"
     extraction_llm_enabled = _parse_bool(os.getenv("SEDU_EXTRACTION_LLM_ENABLED"), default=True)
     extraction_mode = os.getenv("SEDU_EXTRACTION_MODE", "hybrid").strip().lower() or "hybrid"
@@ -104,6 +108,8 @@ def get_settings() -> Settings:
         gemini_model=os.getenv("GEMINI_MODEL", "gemini-2.5-flash"),
         llm_timeout_seconds=llm_timeout_seconds,
         llm_max_retries=llm_max_retries,
+        llm_page_concurrency=llm_page_concurrency,
+        llm_pages_per_call=llm_pages_per_call,
         ocr_lang=ocr_lang,
         extraction_llm_enabled=extraction_llm_enabled,
         extraction_mode=extraction_mode,
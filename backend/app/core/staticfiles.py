@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import hashlib
+import mmap
+import stat as stat_module
+import threading
+from collections import OrderedDict
+from mimetypes import guess_type
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import Response
+from starlette.types import Scope
+
+
+class CachedStaticFiles(StaticFiles):
+    """``StaticFiles`` that memory-maps hot files and answers ``If-None-Match``.
+
+    Plain ``StaticFiles`` re-opens and re-reads a file on every request.
+    Question crops are immutable once written and are re-fetched many times
+    during a review session, so serve them from a small mmap-backed LRU cache
+    keyed by path and short-circuit revalidations with a 304.
+    """
+
+    _cache_max = 256
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._mmap_cache: OrderedDict[str, tuple[mmap.mmap, str, float]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cached_entry(self, path: str) -> tuple[mmap.mmap, str, str] | None:
+        full_path, stat_result = self.lookup_path(path)
+        if stat_result is None or not stat_module.S_ISREG(stat_result.st_mode):
+            return None
+        mtime, size = stat_result.st_mtime, stat_result.st_size
+        media_type = guess_type(full_path)[0] or "application/octet-stream"
+
+        with self._cache_lock:
+            cached = self._mmap_cache.get(full_path)
+            if cached is not None:
+                if cached[2] == mtime:
+                    self._mmap_cache.move_to_end(full_path)
+                    return cached[0], cached[1], media_type
+                cached[0].close()
+                del self._mmap_cache[full_path]
+
+            if size == 0:
+                # mmap cannot map empty files; let the base class handle them.
+                return None
+
+            with open(full_path, "rb") as fh:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+            # Hash the whole file: crops are small and the digest is
+            # computed once per cache entry, and a prefix-only ETag would
+            # collide for files that differ past the prefix.
+            etag = f'"{hashlib.sha256(mapped).hexdigest()}"'
+            self._mmap_cache[full_path] = (mapped, etag, mtime)
+            if len(self._mmap_cache) > self._cache_max:
+                _, (old_mapped, _, _) = self._mmap_cache.popitem(last=False)
+                old_mapped.close()
+            return mapped, etag, media_type
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        # HEAD needs an empty body and Range needs 206 handling — both are
+        # FileResponse features; only plain GETs take the cached path.
+        if scope["method"] != "GET" or any(
+            name == b"range" for name, _ in scope.get("headers", [])
+        ):
+            return await super().get_response(path, scope)
+
+        entry = await anyio.to_thread.run_sync(self._cached_entry, path)
+        if entry is None:
+            return await super().get_response(path, scope)
+
+        mapped, etag, media_type = entry
+        headers = {"etag": etag}
+        for name, value in scope.get("headers", []):
+            if name == b"if-none-match" and etag in value.decode("latin-1"):
+                return Response(status_code=304, headers=headers)
+
+        return Response(content=bytes(mapped), media_type=media_type, headers=headers)
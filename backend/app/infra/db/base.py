@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase
 
+# JSONB on Postgres, plain JSON on SQLite dev/test databases.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     pass
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.infra.db.base import Base
+from app.infra.db.base import Base, JSONVariant
 
 
 class SetRow(Base):
@@ -65,8 +65,8 @@ class QuestionRow(Base):
     review_status: Mapped[str] = mapped_column(String(32), default="unreviewed", index=True)
     confidence: Mapped[float | None] = mapped_column(Float)
     ocr_text: Mapped[str | None] = mapped_column(Text)
-    metadata_json: Mapped[dict] = mapped_column("metadata", JSON, default=dict)
-    structure_json: Mapped[dict] = mapped_column("structure", JSON, default=dict)
+    metadata_json: Mapped[dict] = mapped_column("metadata", JSONVariant, default=dict)
+    structure_json: Mapped[dict] = mapped_column("structure", JSONVariant, default=dict)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     set: Mapped[SetRow] = relationship(back_populates="questions")
@@ -3,6 +3,7 @@ from __future__ import annotations
 from functools import lru_cache
 from pathlib import Path
 
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
@@ -18,7 +19,14 @@ def _normalize_database_url(raw_url: str | None) -> str:
             return raw_url.replace("postgresql://", "postgresql+psycopg://", 1)
         if raw_url.startswith("sqlite:///"):
             path_part = raw_url.removeprefix("sqlite:///")
-            if path_part and path_part != ":memory:" and not path_part.startswith("/"):
+            if (
+                path_part
+                and path_part != ":memory:"
+                and not path_part.startswith("/")
+                # "file:" URIs (e.g. shared-cache in-memory databases) are
+                # not filesystem paths and must pass through untouched.
+                and not path_part.startswith("file:")
+            ):
                 return f"sqlite:///{Path(path_part).resolve()}"
         return raw_url
 
@@ -31,7 +39,10 @@ def get_engine():
     settings = get_settings()
     database_url = _normalize_database_url(settings.database_url)
 
-    kwargs: dict = {}
+    kwargs: dict = {
+        "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+        "json_deserializer": orjson.loads,
+    }
     if database_url.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
 
@@ -147,6 +147,35 @@ class GeminiLLM(LLMPort):
         }
         return self._request_json(payload=payload, system_prompt=system_prompt, model=model)
 
+    def generate_structured_from_media_parts(
+        self,
+        *,
+        prompt: str,
+        schema: dict,
+        media_parts: list[tuple[bytes, str]],
+        system_prompt: str | None = None,
+        model: str | None = None,
+    ) -> dict:
+        parts: list[dict] = [{"text": prompt[:12000]}]
+        for media_bytes, media_mime_type in media_parts:
+            parts.append(
+                {
+                    "inlineData": {
+                        "mimeType": media_mime_type,
+                        "data": base64.b64encode(media_bytes).decode("ascii"),
+                    }
+                }
+            )
+        payload = {
+            "contents": [{"role": "user", "parts": parts}],
+            "generationConfig": {
+                "temperature": 0,
+                "responseMimeType": "application/json",
+                "responseSchema": _to_gemini_response_schema(schema),
+            },
+        }
+        return self._request_json(payload=payload, system_prompt=system_prompt, model=model)
+
     def _request_json(self, *, payload: dict, system_prompt: str | None, model: str | None) -> dict:
         model_name = model or self.model_name
         url = (
@@ -28,3 +28,15 @@ class LLMPort(ABC):
     ) -> dict[str, Any]:
         """Optional multimodal structured generation. Providers may override."""
         raise NotImplementedError("This LLM provider does not support media input.")
+
+    def generate_structured_from_media_parts(
+        self,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        media_parts: list[tuple[bytes, str]],
+        system_prompt: str | None = None,
+        model: str | None = None,
+    ) -> dict[str, Any]:
+        """Optional multi-image structured generation. Providers may override."""
+        raise NotImplementedError("This LLM provider does not support multi-image input.")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 
 class StoragePort(ABC):
@@ -8,6 +9,20 @@ class StoragePort(ABC):
     def save_bytes(self, key: str, data: bytes, content_type: str | None) -> str:
         """Persist bytes and return a retrievable URL or path."""
 
+    def save_bytes_many(self, items: list[tuple[str, bytes, str | None]]) -> list[str]:
+        """Persist several blobs, overlapping the per-blob round-trips.
+
+        Adapters backed by remote object storage may override this with a
+        native bulk/transfer API; the default fans out over threads.
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            key, data, content_type = items[0]
+            return [self.save_bytes(key, data, content_type)]
+        with ThreadPoolExecutor(max_workers=min(16, len(items))) as executor:
+            return list(executor.map(lambda item: self.save_bytes(*item), items))
+
     @abstractmethod
     def build_url(self, key: str) -> str:
         """Resolve a public URL (or local path) for a key."""
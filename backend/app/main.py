@@ -1,21 +1,29 @@
 from __future__ import annotations
 
 import logging
+from contextlib import asynccontextmanager
 
+import anyio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-
 from app.api.v2.router import router as v2_router
 from app.core.config import get_settings
 from app.core.logging import configure_logging
+from app.core.staticfiles import CachedStaticFiles
 from app.infra.db.session import init_db
 
 settings = get_settings()
 configure_logging(logging.INFO)
-init_db()
 
-app = FastAPI(title=settings.app_name, version="2.0.0")
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # Create tables off the event loop; safe no-op once they exist.
+    await anyio.to_thread.run_sync(init_db)
+    yield
+
+
+app = FastAPI(title=settings.app_name, version="2.0.0", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -27,7 +35,7 @@ app.add_middleware(
 app.include_router(v2_router)
 
 settings.upload_dir.mkdir(parents=True, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=str(settings.upload_dir)), name="uploads")
+app.mount("/uploads", CachedStaticFiles(directory=str(settings.upload_dir)), name="uploads")
 
 
 @app.get("/healthz", tags=["health"])
@@ -1,13 +1,135 @@
 from __future__ import annotations
 
+import hashlib
 import io
-import re
-from collections import defaultdict, deque
+import os
+import threading
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 from app.infra.ports.ocr import OCRPort
 from app.infra.ports.storage import StoragePort
 
-_QNO_TOKEN = re.compile(r"^(\d{1,3})(?:[.)]|번)?$")
+# Parsed crop hints, struct-of-arrays: clipping and validation run as a few
+# vectorized ops instead of per-dict float math for every question.
+_HINT_DTYPE = np.dtype(
+    [
+        ("qidx", "i4"),
+        ("page", "i4"),
+        ("top", "f4"),
+        ("bottom", "f4"),
+        ("left", "f4"),
+        ("right", "f4"),
+        ("valid", "?"),
+        ("has_x", "?"),
+    ]
+)
+
+def _qno_from_token(text: str) -> int | None:
+    """Parse a question-number token like ``12``, ``12.``, ``12)`` or ``12번``.
+
+    Equivalent to matching ``^\\d{1,3}(?:[.)]|번)?$`` but without entering the
+    regex engine: OCR emits thousands of tokens per page and nearly all of
+    them fail the first-character digit check.
+    """
+    # ASCII digits only: str.isdigit() also accepts circled/superscript
+    # digits (①, ²) that int() rejects, and those show up as choice markers.
+    if not text or not "0" <= text[0] <= "9":
+        return None
+    i = 1
+    while i < len(text) and "0" <= text[i] <= "9":
+        i += 1
+    if i > 3 or text[i:] not in ("", ".", ")", "번"):
+        return None
+    return int(text[:i])
+
+# Rendered-page cache: the same payload is rasterized by both the hints and
+# canvas paths, and again on retries/re-submits of an identical document.
+_RENDER_CACHE_MAX = 8
+_render_cache: OrderedDict[tuple, list] = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+# OCR start-detection cache: retries and re-submits of the same document
+# re-run pytesseract / the secondary provider on identical pixels, and a
+# single OCR pass costs tens to hundreds of milliseconds.
+_OCR_CACHE_MAX = 64
+_ocr_cache: OrderedDict[tuple, list] = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+# PDF rasterization scale. OCR wants 2x (144 DPI); hint-driven crops only
+# feed human viewers, where ~90 DPI is indistinguishable at ~40% the pixels.
+_OCR_RENDER_SCALE = 2.0
+_HINT_RENDER_SCALE = 1.25
+
+# Cap for direct image uploads on the hint path; libjpeg DCT-downscales to
+# this during decode, so oversized photos never materialize at full size.
+_HINT_MAX_IMAGE_DIM = 2200
+
+# Interpolating bands for unhinted questions is only trustworthy when the
+# hinted neighbours pin down most of the layout; past this missing fraction
+# fall back to OCR start detection for the whole document.
+_HINT_INTERPOLATION_MAX_MISSING = 0.2
+
+# One reusable encode buffer per worker thread; crop encoding happens in
+# tight loops and a fresh BytesIO per crop is pure allocator churn.
+_encode_local = threading.local()
+
+
+def _encode_buffer() -> io.BytesIO:
+    buf = getattr(_encode_local, "buf", None)
+    if buf is None:
+        buf = _encode_local.buf = io.BytesIO()
+    buf.seek(0)
+    buf.truncate()
+    return buf
+
+
+class _VirtualCanvas:
+    """Stitched-canvas crop interface over per-page images.
+
+    Pasting every rendered page into one tall RGB image costs
+    O(total pixels) of allocation and memory traffic just to cut small
+    bands back out of it. This keeps the pages plus their cumulative
+    y-offsets and materializes only the requested band.
+    """
+
+    def __init__(self, pages: list):
+        self.pages = pages
+        self.width = max(page.width for page in pages)
+        self.height = sum(page.height for page in pages)
+        self._offsets: list[int] = []
+        offset = 0
+        for page in pages:
+            self._offsets.append(offset)
+            offset += page.height
+
+    def crop(self, box: tuple[int, int, int, int]):
+        x1, y1, x2, y2 = box
+        y1 = max(0, min(self.height, int(y1)))
+        y2 = max(y1, min(self.height, int(y2)))
+
+        parts = [
+            (offset, page)
+            for offset, page in zip(self._offsets, self.pages)
+            if offset < y2 and offset + page.height > y1
+        ]
+        if len(parts) == 1:
+            offset, page = parts[0]
+            return page.crop((x1, y1 - offset, x2, y2 - offset))
+
+        from PIL import Image
+
+        band = Image.new("RGB", (max(1, x2 - x1), max(1, y2 - y1)), "white")
+        for offset, page in parts:
+            segment = page.crop((x1, max(0, y1 - offset), x2, min(page.height, y2 - offset)))
+            band.paste(segment, (0, max(0, offset - y1)))
+        return band
+
+    def materialize(self):
+        """Full stitched image, for consumers that need real pixels (OCR)."""
+        return QuestionCropper._compose_canvas(self.pages)
 
 
 class QuestionCropper:
@@ -67,93 +189,101 @@ class QuestionCropper:
         return ranges if len(ranges) == count else None
 
     @staticmethod
-    def _ranges_from_page_hints(
+    def _ranges_from_page_hints_partial(
         *,
         page_heights: list[int],
         page_widths: list[int] | None = None,
         question_count: int,
         hints: list[dict | None] | None,
-    ) -> list[tuple[int, int, int, int, int, str]] | None:
+    ) -> tuple[dict[int, tuple[int, int, int, int, int, str]], list[int]]:
+        """Plan per-page crops for every hint that names a usable page.
+
+        Returns a ``qidx -> (page_zero, y1, y2, x1, x2, source)`` map plus the
+        sorted indices whose hints were absent or named no valid page.
+        """
         if question_count <= 0:
-            return []
-        if not page_heights or not hints or len(hints) < question_count:
-            return None
+            return {}, []
+        if not page_heights:
+            return {}, list(range(question_count))
+        hints = hints or []
 
         widths = page_widths or [0] * len(page_heights)
 
-        parsed: list[dict] = []
+        hints_arr = np.zeros(question_count, dtype=_HINT_DTYPE)
+        hints_arr["qidx"] = np.arange(question_count, dtype=np.int32)
+        x_parsed = np.zeros(question_count, dtype=bool)
         for idx in range(question_count):
-            hint = hints[idx]
+            hint = hints[idx] if idx < len(hints) else None
             if not isinstance(hint, dict):
-                return None
+                continue
 
-            page_raw = hint.get("pageIndex")
             try:
-                page_index = int(page_raw)
+                page_index = int(hint.get("pageIndex"))
             except Exception:
-                return None
+                continue
             if page_index < 1 or page_index > len(page_heights):
-                return None
+                continue
 
-            top = hint.get("topRatio")
-            bottom = hint.get("bottomRatio")
+            row = hints_arr[idx]
+            row["page"] = page_index
             try:
-                top_ratio = float(top)
-                bottom_ratio = float(bottom)
-                top_ratio = max(0.0, min(1.0, top_ratio))
-                bottom_ratio = max(0.0, min(1.0, bottom_ratio))
-                valid = bottom_ratio > top_ratio
+                top_ratio = float(hint.get("topRatio"))
+                bottom_ratio = float(hint.get("bottomRatio"))
             except Exception:
-                top_ratio = 0.0
-                bottom_ratio = 0.0
-                valid = False
+                top_ratio = bottom_ratio = 0.0
+            else:
+                row["valid"] = True
+            row["top"] = top_ratio
+            row["bottom"] = bottom_ratio
 
             try:
                 left_ratio = float(hint.get("leftRatio"))
                 right_ratio = float(hint.get("rightRatio"))
-                left_ratio = max(0.0, min(1.0, left_ratio))
-                right_ratio = max(0.0, min(1.0, right_ratio))
-                has_x = right_ratio > left_ratio
             except (TypeError, ValueError):
-                left_ratio = 0.0
-                right_ratio = 1.0
-                has_x = False
-
-            parsed.append(
-                {
-                    "qidx": idx,
-                    "pageIndex": page_index,
-                    "valid": valid,
-                    "top": top_ratio,
-                    "bottom": bottom_ratio,
-                    "left": left_ratio,
-                    "right": right_ratio,
-                    "has_x": has_x,
-                }
-            )
+                left_ratio, right_ratio = 0.0, 1.0
+            else:
+                x_parsed[idx] = True
+            row["left"] = left_ratio
+            row["right"] = right_ratio
+
+        for field in ("top", "bottom", "left", "right"):
+            np.clip(hints_arr[field], 0.0, 1.0, out=hints_arr[field])
+        hints_arr["valid"] &= hints_arr["bottom"] > hints_arr["top"]
+        hints_arr["has_x"] = x_parsed & (hints_arr["right"] > hints_arr["left"])
+
+        # Group by page: stable sort + searchsorted instead of rescanning the
+        # whole hint set once per page.
+        order = np.argsort(hints_arr["page"], kind="stable")
+        pages_sorted = hints_arr["page"][order]
+        group_bounds = np.searchsorted(pages_sorted, np.arange(1, len(page_heights) + 2))
 
         assigned: dict[int, tuple[int, int, int, int, str]] = {}
         for page_index in range(1, len(page_heights) + 1):
-            locals_for_page = [item for item in parsed if item["pageIndex"] == page_index]
-            if not locals_for_page:
+            lo, hi = int(group_bounds[page_index - 1]), int(group_bounds[page_index])
+            if lo == hi:
                 continue
+            locals_for_page = hints_arr[order[lo:hi]]
+            count = hi - lo
 
             # Group by column to deconflict Y-axis independently per column
-            col_groups: dict[str, list[tuple[int, dict]]] = {}
-            for local_idx, item in enumerate(locals_for_page):
-                col = "left" if item["has_x"] and item["left"] < 0.4 else (
-                    "right" if item["has_x"] and item["left"] >= 0.4 else "full"
-                )
-                col_groups.setdefault(col, []).append((local_idx, item))
+            col_codes = np.where(
+                locals_for_page["has_x"],
+                np.where(locals_for_page["left"] < 0.4, 0, 1),
+                2,
+            )
 
-            count = len(locals_for_page)
             ratios: list[tuple[float, float] | None] = [None] * count
             sources: list[str] = ["fallback"] * count
 
-            for _col, col_items in col_groups.items():
-                col_items.sort(key=lambda pair: pair[1]["top"])
+            for col in (0, 1, 2):
+                col_locals = np.flatnonzero(col_codes == col)
+                if col_locals.size == 0:
+                    continue
+                col_locals = col_locals[np.argsort(locals_for_page["top"][col_locals], kind="stable")]
                 prev_end = 0.0
-                for local_idx, item in col_items:
+                for raw_idx in col_locals:
+                    local_idx = int(raw_idx)
+                    item = locals_for_page[local_idx]
                     if not item["valid"]:
                         continue
                     top = max(prev_end, float(item["top"]))
@@ -164,28 +294,23 @@ class QuestionCropper:
                     sources[local_idx] = "gemini"
                     prev_end = bottom
 
-            cursor = 0
-            while cursor < count:
-                if ratios[cursor] is not None:
-                    cursor += 1
-                    continue
-                end = cursor
-                while end < count and ratios[end] is None:
-                    end += 1
-
-                left = ratios[cursor - 1][1] if cursor > 0 and ratios[cursor - 1] is not None else 0.0
-                right = ratios[end][0] if end < count and ratios[end] is not None else 1.0
+            # Fill unresolved stretches by evenly dividing the gap between
+            # their resolved neighbours; runs come from one diff over the
+            # missing mask and each run fills from a single linspace.
+            missing_mask = np.array([ratio is None for ratio in ratios], dtype=np.int8)
+            run_edges = np.flatnonzero(np.diff(np.r_[0, missing_mask, 0]))
+            for run_s, run_e in zip(run_edges[::2], run_edges[1::2]):
+                run_s, run_e = int(run_s), int(run_e)
+                left = ratios[run_s - 1][1] if run_s > 0 else 0.0
+                right = ratios[run_e][0] if run_e < count else 1.0
                 if right <= left:
-                    right = min(1.0, left + (0.08 * max(1, end - cursor)))
+                    right = min(1.0, left + (0.08 * max(1, run_e - run_s)))
 
                 span = max(0.001, right - left)
-                step = span / max(1, end - cursor)
-                for fill_idx in range(cursor, end):
-                    top = left + step * (fill_idx - cursor)
-                    bottom = left + step * (fill_idx - cursor + 1)
-                    ratios[fill_idx] = (top, bottom)
+                bounds = left + np.linspace(0.0, span, run_e - run_s + 1)
+                for pos, fill_idx in enumerate(range(run_s, run_e)):
+                    ratios[fill_idx] = (float(bounds[pos]), float(bounds[pos + 1]))
                     sources[fill_idx] = "fallback"
-                cursor = end
 
             page_height = max(1, int(page_heights[page_index - 1]))
             page_width = max(1, int(widths[page_index - 1])) if widths else page_height
@@ -207,15 +332,39 @@ class QuestionCropper:
                     x2 = page_width
                 assigned[int(item["qidx"])] = (y1, y2, x1, x2, sources[local_idx])
 
-        if len(assigned) != question_count:
-            return None
-
-        planned: list[tuple[int, int, int, int, int, str]] = []
+        planned: dict[int, tuple[int, int, int, int, int, str]] = {}
+        missing: list[int] = []
         for qidx in range(question_count):
-            item = parsed[qidx]
-            y1, y2, x1, x2, source = assigned[qidx]
-            planned.append((int(item["pageIndex"]) - 1, y1, y2, x1, x2, source))
-        return planned
+            entry = assigned.get(qidx)
+            if entry is None:
+                missing.append(qidx)
+                continue
+            y1, y2, x1, x2, source = entry
+            planned[qidx] = (int(hints_arr["page"][qidx]) - 1, y1, y2, x1, x2, source)
+        return planned, missing
+
+    @staticmethod
+    def _ranges_from_page_hints(
+        *,
+        page_heights: list[int],
+        page_widths: list[int] | None = None,
+        question_count: int,
+        hints: list[dict | None] | None,
+    ) -> list[tuple[int, int, int, int, int, str]] | None:
+        """Strict variant: all-or-nothing planning over page-level hints."""
+        if question_count <= 0:
+            return []
+        if not page_heights or not hints or len(hints) < question_count:
+            return None
+        planned, missing = QuestionCropper._ranges_from_page_hints_partial(
+            page_heights=page_heights,
+            page_widths=page_widths,
+            question_count=question_count,
+            hints=hints,
+        )
+        if missing:
+            return None
+        return [planned[qidx] for qidx in range(question_count)]
 
     @staticmethod
     def _normalize_ranges(height: int, count: int, starts: list[int] | None = None) -> list[tuple[int, int]]:
@@ -253,10 +402,15 @@ class QuestionCropper:
     def _parse_question_no(label: str | None) -> int | None:
         if not label:
             return None
-        matched = re.match(r"^\s*(\d{1,3})", str(label))
-        if not matched:
-            return None
-        return int(matched.group(1))
+        # Leading-digit scan; called once per label in tight loops where
+        # regex dispatch is disproportionate.
+        text = str(label).lstrip()
+        digits = min(3, len(text))
+        i = 0
+        # ASCII digits only, for the same reason as _qno_from_token.
+        while i < digits and "0" <= text[i] <= "9":
+            i += 1
+        return int(text[:i]) if i else None
 
     @staticmethod
     def _pick_starts_for_questions(
@@ -268,12 +422,15 @@ class QuestionCropper:
         if not detected_starts:
             return []
 
-        ordered = sorted((max(0, min(height - 1, y)), qno) for y, qno in detected_starts)
-        by_qno: dict[int, deque[int]] = defaultdict(deque)
-        y_list: list[int] = []
-        for y, qno in ordered:
-            by_qno[int(qno)].append(int(y))
-            y_list.append(int(y))
+        # Bucket by question number in one pass; each bucket is sorted lazily
+        # on first use. The positional fallback scans the full sorted list —
+        # candidates at or below the previous pick are consumed without
+        # producing a start, so a truncated pool could run dry early.
+        clamped = [(max(0, min(height - 1, int(y))), int(qno)) for y, qno in detected_starts]
+        by_qno: dict[int, list[int] | deque[int]] = defaultdict(list)
+        for y, qno in clamped:
+            by_qno[qno].append(y)
+        y_list = sorted(y for y, _ in clamped)
 
         picked: list[int] = []
         cursor = 0
@@ -281,8 +438,11 @@ class QuestionCropper:
             target_qno = QuestionCropper._parse_question_no(label)
             chosen: int | None = None
 
-            if target_qno is not None and by_qno[target_qno]:
-                chosen = by_qno[target_qno].popleft()
+            bucket = by_qno.get(target_qno) if target_qno is not None else None
+            if bucket:
+                if not isinstance(bucket, deque):
+                    bucket = by_qno[target_qno] = deque(sorted(bucket))
+                chosen = bucket.popleft()
             else:
                 while cursor < len(y_list):
                     candidate = y_list[cursor]
@@ -331,10 +491,8 @@ class QuestionCropper:
             if not isinstance(token, dict):
                 continue
             text = str(token.get("text") or "").strip().replace(" ", "")
-            if not text:
-                continue
-            matched = _QNO_TOKEN.match(text)
-            if not matched:
+            qno = _qno_from_token(text)
+            if qno is None:
                 continue
             bbox = token.get("bbox")
             if not isinstance(bbox, dict):
@@ -343,7 +501,6 @@ class QuestionCropper:
             y = int(bbox.get("y1") or 0)
             if x > left_gate:
                 continue
-            qno = int(matched.group(1))
             if qno <= 0 or qno > 200:
                 continue
             starts.append((y, qno))
@@ -358,7 +515,36 @@ class QuestionCropper:
         return filtered
 
     @staticmethod
-    def _render_pages(payload: bytes, content_type: str | None, filename: str | None):
+    def _render_pages(
+        payload: bytes,
+        content_type: str | None,
+        filename: str | None,
+        scale: float = _OCR_RENDER_SCALE,
+    ):
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        cache_key = (digest, (content_type or "").lower(), (filename or "").lower().rsplit(".", 1)[-1], scale)
+        with _render_cache_lock:
+            cached = _render_cache.get(cache_key)
+            if cached is not None:
+                _render_cache.move_to_end(cache_key)
+                return list(cached)
+
+        pages = QuestionCropper._render_pages_uncached(payload, content_type, filename, scale)
+        if pages:
+            with _render_cache_lock:
+                _render_cache[cache_key] = list(pages)
+                _render_cache.move_to_end(cache_key)
+                while len(_render_cache) > _RENDER_CACHE_MAX:
+                    _render_cache.popitem(last=False)
+        return pages
+
+    @staticmethod
+    def _render_pages_uncached(
+        payload: bytes,
+        content_type: str | None,
+        filename: str | None,
+        scale: float = _OCR_RENDER_SCALE,
+    ):
         try:
             from PIL import Image
         except Exception:
@@ -369,7 +555,11 @@ class QuestionCropper:
 
         if mime.startswith("image/") or lower_name.endswith((".png", ".jpg", ".jpeg")):
             try:
-                return [Image.open(io.BytesIO(payload)).convert("RGB")]
+                image = Image.open(io.BytesIO(payload))
+                if scale < _OCR_RENDER_SCALE:
+                    # draft() is a no-op for non-JPEG sources.
+                    image.draft("RGB", (_HINT_MAX_IMAGE_DIM, _HINT_MAX_IMAGE_DIM))
+                return [image.convert("RGB")]
             except Exception:
                 return []
 
@@ -382,22 +572,49 @@ class QuestionCropper:
             try:
                 doc = fitz.open(stream=payload, filetype="pdf")
                 try:
-                    pages = []
-                    for page in doc:
-                        pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
-                        img = Image.open(io.BytesIO(pix.tobytes("png"))).convert("RGB")
-                        pages.append(img)
-                    return pages
+                    page_count = doc.page_count
                 finally:
                     doc.close()
             except Exception:
                 return []
+            if page_count <= 0:
+                return []
+
+            # One matrix for every page; get_pixmap never mutates it.
+            render_matrix = fitz.Matrix(scale, scale)
+
+            def _render_one(index: int):
+                # fitz documents are not thread-safe; open one per worker.
+                local = fitz.open(stream=payload, filetype="pdf")
+                try:
+                    # Read the raw RGB samples directly; encoding to PNG just
+                    # to decode it again would cost two zlib passes per page.
+                    # samples_mv views the pixmap buffer without the bytes
+                    # copy that plain .samples makes first.
+                    pix = local[index].get_pixmap(matrix=render_matrix, alpha=False, colorspace=fitz.csRGB)
+                    return Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
+                finally:
+                    local.close()
+
+            try:
+                if page_count == 1:
+                    return [_render_one(0)]
+                # get_pixmap releases the GIL, so threads give near-linear speedup.
+                max_workers = min(8, os.cpu_count() or 1, page_count)
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    return list(executor.map(_render_one, range(page_count)))
+            except Exception:
+                return []
 
         return []
 
     @staticmethod
     def _render_canvas(payload: bytes, content_type: str | None, filename: str | None):
         pages = QuestionCropper._render_pages(payload, content_type, filename)
+        return QuestionCropper._compose_canvas(pages)
+
+    @staticmethod
+    def _compose_canvas(pages):
         if not pages:
             return None
         if len(pages) == 1:
@@ -413,7 +630,67 @@ class QuestionCropper:
             y += page_img.height
         return canvas
 
+    def _detect_question_starts_per_page(self, pages: list) -> list[tuple[int, int]]:
+        """Run secondary OCR page-by-page and merge starts with y-offsets.
+
+        Providers cap image dimensions and bill per request either way:
+        per-page payloads stay within the limits, and the requests overlap
+        instead of serializing behind one oversized stitched image.
+        """
+        if not pages or not self._can_use_secondary_ocr():
+            return []
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+                payloads = list(executor.map(self._encode_png, pages))
+            extract_batch = getattr(self.secondary_ocr, "extract_batch", None)
+            if callable(extract_batch):
+                extracted = extract_batch(payloads)
+            else:
+                with ThreadPoolExecutor(max_workers=min(8, len(pages))) as executor:
+                    extracted = list(executor.map(self.secondary_ocr.extract, payloads))  # type: ignore[union-attr]
+        except Exception:
+            return []
+
+        starts: list[tuple[int, int]] = []
+        offset = 0
+        for page, result in zip(pages, extracted):
+            tokens = result.get("tokens") if isinstance(result, dict) else None
+            if isinstance(tokens, list):
+                page_starts = self._starts_from_tokens(tokens, int(page.width))
+                starts.extend((y + offset, qno) for y, qno in page_starts)
+            offset += page.height
+        return starts
+
     def _detect_question_starts(self, image) -> list[tuple[int, int]]:
+        if isinstance(image, _VirtualCanvas):
+            if len(image.pages) > 1:
+                starts = self._detect_question_starts_per_page(image.pages)
+                if starts:
+                    return starts
+            image = image.materialize()
+
+        try:
+            digest = hashlib.blake2b(image.tobytes(), digest_size=16).digest()
+        except Exception:
+            return self._detect_question_starts_uncached(image)
+        provider = str(getattr(self.secondary_ocr, "provider_name", "") or "")
+        cache_key = (digest, image.width, image.height, self.ocr_lang, provider)
+        with _ocr_cache_lock:
+            cached = _ocr_cache.get(cache_key)
+            if cached is not None:
+                _ocr_cache.move_to_end(cache_key)
+                return list(cached)
+
+        starts = self._detect_question_starts_uncached(image)
+        with _ocr_cache_lock:
+            _ocr_cache[cache_key] = list(starts)
+            _ocr_cache.move_to_end(cache_key)
+            while len(_ocr_cache) > _OCR_CACHE_MAX:
+                _ocr_cache.popitem(last=False)
+        return starts
+
+    def _detect_question_starts_uncached(self, image) -> list[tuple[int, int]]:
         if self._can_use_secondary_ocr():
             try:
                 payload = self._encode_png(image)
@@ -451,15 +728,13 @@ class QuestionCropper:
             token = str(data["text"][idx] or "").strip()
             if not token:
                 continue
-            token = token.replace(" ", "")
-            matched = _QNO_TOKEN.match(token)
-            if not matched:
+            qno = _qno_from_token(token.replace(" ", ""))
+            if qno is None:
                 continue
             x = int(data["left"][idx] or 0)
             y = int(data["top"][idx] or 0)
             if x > left_gate:
                 continue
-            qno = int(matched.group(1))
             if qno <= 0 or qno > 200:
                 continue
             starts.append((y, qno))
@@ -476,10 +751,98 @@ class QuestionCropper:
 
     @staticmethod
     def _encode_png(image) -> bytes:
-        buf = io.BytesIO()
-        image.save(buf, format="PNG")
+        buf = _encode_buffer()
+        # Level-1 zlib is several times faster than the default for these
+        # scan-like crops at a negligible size cost.
+        image.save(buf, format="PNG", compress_level=1, optimize=False)
+        return buf.getvalue()
+
+    @staticmethod
+    def _encode_jpeg(image) -> bytes:
+        buf = _encode_buffer()
+        image.save(buf, format="JPEG", quality=85, optimize=False, progressive=False)
         return buf.getvalue()
 
+    def _store_crops(self, set_id: str, crops: list[tuple[int, object]]) -> dict[int, str | None]:
+        """Encode and upload crops concurrently, keyed by 1-based question index."""
+
+        def _encode(item: tuple[int, object]) -> tuple[int, str, bytes, str]:
+            idx, crop = item
+            # Pre-encoded bytes (e.g. a full-page crop of a JPEG upload) are
+            # stored as-is, skipping the decode/re-encode round-trip.
+            if isinstance(crop, bytes):
+                return idx, f"{set_id}/questions/q_{idx:03d}.jpg", crop, "image/jpeg"
+            # JPEG is several times smaller and faster to encode for scanned
+            # content; keep PNG only for crops that carry alpha.
+            if "A" in getattr(crop, "mode", ""):
+                suffix, mime, payload = ".png", "image/png", self._encode_png(crop)
+            else:
+                suffix, mime, payload = ".jpg", "image/jpeg", self._encode_jpeg(crop)
+            return idx, f"{set_id}/questions/q_{idx:03d}{suffix}", payload, mime
+
+        if not crops:
+            return {}
+        if len(crops) == 1:
+            encoded = [_encode(crops[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=min(8, len(crops))) as executor:
+                encoded = list(executor.map(_encode, crops))
+        urls = self.storage.save_bytes_many([(key, payload, mime) for _, key, payload, mime in encoded])
+        return {idx: url for (idx, _key, _payload, _mime), url in zip(encoded, urls)}
+
+    def _store_partial_hint_traces(
+        self,
+        *,
+        set_id: str,
+        pages: list,
+        question_count: int,
+        planned_map: dict[int, tuple[int, int, int, int, int, str]],
+        missing: list[int],
+    ) -> list[dict]:
+        """Crop hinted questions directly and interpolate the few without hints.
+
+        Bands for unhinted questions are split evenly between their hinted
+        neighbours on the virtual canvas, so no OCR pass is needed at all.
+        """
+        canvas = _VirtualCanvas(pages)
+        offsets = [0]
+        for page in pages:
+            offsets.append(offsets[-1] + page.height)
+
+        traces = [{"url": None, "cropSource": "fallback"} for _ in range(question_count)]
+        crops: list[tuple[int, object]] = []
+        anchors: dict[int, tuple[int, int]] = {}
+        for qidx, (page_zero, y1, y2, x1, x2, source) in planned_map.items():
+            traces[qidx]["cropSource"] = source
+            traces[qidx]["pageIndex"] = page_zero + 1
+            if y2 > y1:
+                crops.append((qidx + 1, pages[page_zero].crop((x1, y1, x2, y2))))
+            anchors[qidx] = (offsets[page_zero] + y1, offsets[page_zero] + y2)
+
+        run_start = 0
+        while run_start < len(missing):
+            run_end = run_start
+            while run_end + 1 < len(missing) and missing[run_end + 1] == missing[run_end] + 1:
+                run_end += 1
+            first, last = missing[run_start], missing[run_end]
+            run_len = run_end - run_start + 1
+
+            top = anchors[first - 1][1] if first - 1 in anchors else 0
+            bottom = anchors[last + 1][0] if last + 1 in anchors else canvas.height
+            if bottom <= top:
+                bottom = min(canvas.height, top + 30 * run_len)
+            step = max(1, (bottom - top) // run_len)
+            for pos, qidx in enumerate(missing[run_start : run_end + 1]):
+                y1 = top + pos * step
+                y2 = bottom if pos == run_len - 1 else min(bottom, y1 + step)
+                if y2 > y1:
+                    crops.append((qidx + 1, canvas.crop((0, y1, canvas.width, y2))))
+            run_start = run_end + 1
+
+        for idx, url in self._store_crops(set_id, crops).items():
+            traces[idx - 1]["url"] = url
+        return traces
+
     def _create_and_store_traces(
         self,
         *,
@@ -494,28 +857,65 @@ class QuestionCropper:
         if question_count <= 0:
             return []
 
-        pages = self._render_pages(payload=payload, content_type=content_type, filename=filename)
+        # Render at reduced DPI when the hints look complete enough to crop
+        # without OCR; the fallback path re-renders at OCR scale if needed.
+        hinted = bool(question_crop_hints) and len(question_crop_hints) >= question_count and all(
+            isinstance(hint, dict) and hint.get("pageIndex") is not None and hint.get("topRatio") is not None
+            for hint in question_crop_hints[:question_count]
+        )
+        scale = _HINT_RENDER_SCALE if hinted else _OCR_RENDER_SCALE
+        pages = self._render_pages(payload=payload, content_type=content_type, filename=filename, scale=scale)
         if pages:
-            planned = self._ranges_from_page_hints(
+            planned_map, missing = self._ranges_from_page_hints_partial(
                 page_heights=[int(page.height) for page in pages],
                 page_widths=[int(page.width) for page in pages],
                 question_count=question_count,
                 hints=question_crop_hints,
             )
-            if planned is not None and len(planned) == question_count:
+            if planned_map and not missing:
+                jpeg_source = len(pages) == 1 and (
+                    (content_type or "").lower().startswith("image/jpeg")
+                    or (filename or "").lower().endswith((".jpg", ".jpeg"))
+                )
                 traces: list[dict] = []
-                for idx, (page_zero, y1, y2, x1, x2, source) in enumerate(planned, start=1):
-                    page_img = pages[page_zero]
+                crops: list[tuple[int, object]] = []
+                for idx in range(1, question_count + 1):
+                    page_zero, y1, y2, x1, x2, source = planned_map[idx - 1]
+                    traces.append({"url": None, "cropSource": source, "pageIndex": page_zero + 1})
                     if y2 <= y1:
-                        traces.append({"url": None, "cropSource": source, "pageIndex": page_zero + 1})
                         continue
-                    crop = page_img.crop((x1, y1, x2, y2))
-                    key = f"{set_id}/questions/q_{idx:03d}.png"
-                    url = self.storage.save_bytes(key, self._encode_png(crop), "image/png")
-                    traces.append({"url": url, "cropSource": source, "pageIndex": page_zero + 1})
+                    page = pages[page_zero]
+                    if jpeg_source and x1 <= 0 and y1 <= 0 and x2 >= page.width and y2 >= page.height:
+                        # Whole-page crop of a JPEG upload: reuse the original
+                        # compressed bytes instead of decode + re-encode.
+                        crops.append((idx, payload))
+                    else:
+                        crops.append((idx, page.crop((x1, y1, x2, y2))))
+                for idx, url in self._store_crops(set_id, crops).items():
+                    traces[idx - 1]["url"] = url
                 return traces
+            if planned_map and missing and len(missing) <= question_count * _HINT_INTERPOLATION_MAX_MISSING:
+                return self._store_partial_hint_traces(
+                    set_id=set_id,
+                    pages=pages,
+                    question_count=question_count,
+                    planned_map=planned_map,
+                    missing=missing,
+                )
 
-        canvas = self._render_canvas(payload=payload, content_type=content_type, filename=filename)
+        # Pages are already in memory on the fallback path; crop straight from
+        # them instead of allocating the full stitched image, and only
+        # re-enter the render pipeline when nothing could be rendered at all.
+        if pages:
+            if scale != _OCR_RENDER_SCALE:
+                # Hint planning fell through after all; OCR detection wants
+                # the full-resolution render.
+                pages = self._render_pages(
+                    payload=payload, content_type=content_type, filename=filename, scale=_OCR_RENDER_SCALE
+                ) or pages
+            canvas = _VirtualCanvas(pages)
+        else:
+            canvas = self._render_canvas(payload=payload, content_type=content_type, filename=filename)
         if canvas is None:
             return [{"url": None, "cropSource": "fallback"} for _ in range(question_count)]
 
@@ -539,15 +939,14 @@ class QuestionCropper:
         if not ranges:
             return [{"url": None, "cropSource": "fallback"} for _ in range(question_count)]
 
-        traces: list[dict] = []
-        for idx, (y1, y2) in enumerate(ranges, start=1):
-            if y2 <= y1:
-                traces.append({"url": None, "cropSource": "fallback"})
-                continue
-            crop = canvas.crop((0, y1, canvas.width, y2))
-            key = f"{set_id}/questions/q_{idx:03d}.png"
-            url = self.storage.save_bytes(key, self._encode_png(crop), "image/png")
-            traces.append({"url": url, "cropSource": "fallback"})
+        traces = [{"url": None, "cropSource": "fallback"} for _ in ranges]
+        crops = [
+            (idx, canvas.crop((0, y1, canvas.width, y2)))
+            for idx, (y1, y2) in enumerate(ranges, start=1)
+            if y2 > y1
+        ]
+        for idx, url in self._store_crops(set_id, crops).items():
+            traces[idx - 1]["url"] = url
         return traces
 
     def create_and_store_with_trace(
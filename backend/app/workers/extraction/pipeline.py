@@ -1,18 +1,51 @@
 from __future__ import annotations
 
+import copy
+import hashlib
 import io
-import json
+import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Any
 
+import numpy as np
+import orjson
+
 from app.infra.ports.llm import LLMPort
 from app.infra.ports.ocr import OCRPort
 from app.workers.extraction.cropper import QuestionCropper
 
 _QUESTION_PATTERN = re.compile(r"(?m)^\s*(\d{1,3})\s*(?:[.)]|번)\s+")
-_CHOICE_PATTERN = re.compile(r"(?m)^\s*(?:[①-⑤]|[ㄱ-ㅎ]|[A-Ea-e]|[1-5])(?:[.)]|\s)\s*(.+)$")
+# Cheap pre-check: no line starts with a digit means no question anchors,
+# so the full multi-line scan can be skipped outright.
+_LINE_START_DIGIT = re.compile(r"(?m)^\s*\d")
+_CHOICE_PATTERN = re.compile(r"^\s*(?:[①-⑤]|[ㄱ-ㅎ]|[A-Ea-e]|[1-5])(?:[.)]|\s)\s*(.+)$")
+# First characters a choice line can start with; lines failing this set test
+# never enter the regex engine.
+_CHOICE_FIRST_CHARS = frozenset("①②③④⑤ABCDEabcde12345") | frozenset(
+    chr(code) for code in range(0x3131, 0x314F)  # ㄱ-ㅎ
+)
 _MAX_GEMINI_MEDIA_BYTES = 3_500_000
+# Hard cap on a single subprocess tesseract run so a hung binary cannot
+# stall the whole extraction job.
+_TESSERACT_TIMEOUT = 30
+# tesserocr engines are not thread-safe; pages OCR in parallel, so each
+# worker thread keeps its own initialized instance.
+_tesserocr_local = threading.local()
+# Laplacian-variance focus score above which a page is sharp enough that
+# median-blur denoising only costs time without helping OCR.
+_SHARPNESS_SKIP_THRESHOLD = 300.0
+
+# Content-addressed LLM response cache: retries and reprocessing re-issue
+# byte-identical prompts, and every avoided call saves seconds and quota.
+_LLM_CACHE_MAX = 512
+# Finished refinements memoized per pipeline instance (see _refine_with_llm).
+_REFINE_CACHE_MAX = 128
+_llm_cache: OrderedDict[bytes, Any] = OrderedDict()
+_llm_cache_lock = threading.Lock()
 _LLM_REFINEMENT_SCHEMA: dict[str, Any] = {
     "type": "object",
     "required": ["questions"],
@@ -65,6 +98,23 @@ _LLM_MEDIA_EXTRACTION_SCHEMA: dict[str, Any] = {
         }
     },
 }
+_LLM_MEDIA_BATCH_EXTRACTION_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "required": ["pages"],
+    "properties": {
+        "pages": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "required": ["pageIndex", "questions"],
+                "properties": {
+                    "pageIndex": {"type": "integer"},
+                    "questions": _LLM_MEDIA_EXTRACTION_SCHEMA["properties"]["questions"],
+                },
+            },
+        }
+    },
+}
 _LLM_MEDIA_RAW_TEXT_SCHEMA: dict[str, Any] = {
     "type": "object",
     "required": ["rawText"],
@@ -72,6 +122,37 @@ _LLM_MEDIA_RAW_TEXT_SCHEMA: dict[str, Any] = {
         "rawText": {"type": "string"},
     },
 }
+# Parsing rules shared by the single-page and multi-page media prompts.
+_MEDIA_PROMPT_RULES = (
+    "Rules:\n"
+    "1) Detect the page layout: single-column or two-column.\n"
+    "2) For two-column layouts, process in reading order: "
+    "left column top-to-bottom first, then right column top-to-bottom.\n"
+    "3) Keep numberLabel exactly as visible.\n"
+    "4) text must contain the full question body and all options.\n"
+    "5) confidence is 0~1.\n"
+    "6) cropTopRatio/cropBottomRatio are normalized vertical positions (0~1) "
+    "on that question's own page image. They must tightly enclose only that question.\n"
+    "7) cropLeftRatio/cropRightRatio are normalized horizontal positions (0~1). "
+    "Left-column questions: cropLeftRatio~0.0, cropRightRatio~0.5. "
+    "Right-column questions: cropLeftRatio~0.5, cropRightRatio~1.0. "
+    "Full-width questions (headers, single-column): cropLeftRatio=0.0, cropRightRatio=1.0.\n"
+    "8) Crop regions must NOT overlap between questions.\n"
+    "9) If any crop ratio is uncertain, return null for that field.\n"
+    "10) If metadata cannot be inferred, use 'unknown'."
+)
+# Canonical bytes of the schema constants above, serialized once at import.
+# Keyed by id(): the constants live for the whole process, so their ids are
+# stable; ad-hoc schemas miss and get serialized per call.
+_SCHEMA_CANONICAL: dict[int, bytes] = {
+    id(schema): orjson.dumps(schema, option=orjson.OPT_SORT_KEYS)
+    for schema in (
+        _LLM_REFINEMENT_SCHEMA,
+        _LLM_MEDIA_EXTRACTION_SCHEMA,
+        _LLM_MEDIA_BATCH_EXTRACTION_SCHEMA,
+        _LLM_MEDIA_RAW_TEXT_SCHEMA,
+    )
+}
 
 
 @dataclass
@@ -84,6 +165,11 @@ class ExtractedQuestion:
     structure: dict[str, Any] = field(default_factory=dict)
 
 
+def _page_order_key(q: ExtractedQuestion) -> tuple[int, str]:
+    """Within-page ordering: model-reported position, then label."""
+    return (int(q.order_index or 0), str(q.number_label or ""))
+
+
 @dataclass
 class ExtractionResult:
     questions: list[ExtractedQuestion]
@@ -105,6 +191,8 @@ class DocumentExtractionPipeline:
         llm_enabled: bool = True,
         llm_model: str | None = None,
         extraction_mode: str = "hybrid",
+        page_concurrency: int = 8,
+        pages_per_call: int = 1,
     ):
         self.ocr_fallback = ocr_fallback
         self.ocr_lang = ocr_lang.strip() if ocr_lang and ocr_lang.strip() else "kor+eng"
@@ -112,16 +200,49 @@ class DocumentExtractionPipeline:
         self.llm_enabled = llm_enabled
         self.llm_model = llm_model
         self.extraction_mode = extraction_mode.strip().lower() if extraction_mode else "hybrid"
+        # Upper bound on concurrent per-page LLM calls; tune via
+        # SEDU_LLM_PAGE_CONCURRENCY to match the provider's rate limit.
+        self.page_concurrency = max(1, page_concurrency)
+        # Pages marshalled into one multi-image LLM call; >1 trades a little
+        # per-call latency for fewer round-trips against rate limits
+        # (SEDU_LLM_PAGES_PER_CALL).
+        self.pages_per_call = max(1, pages_per_call)
+        self._refine_cache: OrderedDict[bytes, list[ExtractedQuestion]] = OrderedDict()
+        self._refine_cache_lock = threading.Lock()
+        # Adapters never change after construction, so resolve the
+        # capability checks once instead of reflecting per question.
+        llm_provider = str(getattr(llm, "provider_name", "") or "").lower()
+        self._llm_usable = llm_enabled and llm is not None and llm_provider != "mock"
+        self._llm_multimodal = self._llm_usable and callable(
+            getattr(llm, "generate_structured_from_media", None)
+        )
+        self._secondary_ocr_provider = str(getattr(ocr_fallback, "provider_name", "") or "").lower()
 
     @staticmethod
     def _normalize_text(text: str) -> str:
-        return text.replace("\r\n", "\n").replace("\r", "\n").strip()
+        # OCR/LLM output rarely contains carriage returns, and callers often
+        # re-normalize already-clean text; one memchr scan skips both full
+        # replace passes in that common case.
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text.strip()
 
     @staticmethod
     def _split_questions(raw_text: str) -> list[tuple[str | None, str]]:
         text = DocumentExtractionPipeline._normalize_text(raw_text)
         if not text:
             return []
+        if _LINE_START_DIGIT.search(text) is None:
+            return [(None, text)]
+
+        if "\n" not in text:
+            # Single-line input (e.g. one-question image OCR): the only
+            # possible anchor sits at position 0, so there is nothing to
+            # split and the full scan can be skipped.
+            match = _QUESTION_PATTERN.match(text)
+            if match is None:
+                return [(None, text)]
+            return [(match.group(1), text)]
 
         candidates = list(_QUESTION_PATTERN.finditer(text))
         if not candidates:
@@ -148,11 +269,19 @@ class DocumentExtractionPipeline:
 
     @staticmethod
     def _build_structure(question_text: str) -> dict[str, Any]:
-        choices = [
-            {"label": str(i + 1), "text": item.group(1).strip()}
-            for i, item in enumerate(_CHOICE_PATTERN.finditer(question_text))
-            if item.group(1).strip()
-        ]
+        choices: list[dict[str, str]] = []
+        match_count = 0
+        for line in question_text.splitlines():
+            stripped = line.lstrip()
+            if not stripped or stripped[0] not in _CHOICE_FIRST_CHARS:
+                continue
+            matched = _CHOICE_PATTERN.match(line)
+            if not matched:
+                continue
+            match_count += 1
+            choice_text = matched.group(1).strip()
+            if choice_text:
+                choices.append({"label": str(match_count), "text": choice_text})
         return {
             "parsed_v1": {
                 "stem": question_text,
@@ -162,6 +291,12 @@ class DocumentExtractionPipeline:
 
     @staticmethod
     def _to_int(value: Any, default: int) -> int:
+        # Missing fields arrive as None; answering without raising keeps the
+        # exception machinery out of the per-field hot path.
+        if value is None:
+            return default
+        if isinstance(value, int):
+            return int(value)
         try:
             return int(value)
         except Exception:
@@ -169,32 +304,157 @@ class DocumentExtractionPipeline:
 
     @staticmethod
     def _to_confidence(value: Any, default: float) -> float:
+        if value is None:
+            return max(0.0, min(1.0, default))
+        if isinstance(value, (int, float)):
+            return max(0.0, min(1.0, float(value)))
         try:
             parsed = float(value)
         except Exception:
             return max(0.0, min(1.0, default))
         return max(0.0, min(1.0, parsed))
 
+    def _llm_cache_key(
+        self,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+        media_bytes: bytes = b"",
+    ) -> bytes:
+        model = self.llm_model or str(getattr(self.llm, "model_name", "") or "")
+        # The adapter is a process-wide singleton in the app; tagging each
+        # instance keeps responses from distinct backends apart (id() is
+        # unsafe here because freed addresses get reused).
+        tag = getattr(self.llm, "_llm_cache_tag", None)
+        if tag is None:
+            tag = os.urandom(8).hex()
+            try:
+                setattr(self.llm, "_llm_cache_tag", tag)
+            except Exception:
+                pass
+        hasher = hashlib.sha256()
+        for part in (
+            tag.encode(),
+            prompt.encode(),
+            _SCHEMA_CANONICAL.get(id(schema))
+            or orjson.dumps(schema, option=orjson.OPT_SORT_KEYS),
+            (system_prompt or "").encode(),
+            media_bytes,
+            model.encode(),
+        ):
+            # Length-prefix each part so boundaries cannot collide.
+            hasher.update(len(part).to_bytes(8, "big"))
+            hasher.update(part)
+        return hasher.digest()
+
+    @staticmethod
+    def _llm_cache_get(key: bytes) -> Any:
+        with _llm_cache_lock:
+            cached = _llm_cache.get(key)
+            if cached is not None:
+                _llm_cache.move_to_end(key)
+            return cached
+
+    @staticmethod
+    def _llm_cache_put(key: bytes, value: Any) -> None:
+        with _llm_cache_lock:
+            _llm_cache[key] = value
+            _llm_cache.move_to_end(key)
+            while len(_llm_cache) > _LLM_CACHE_MAX:
+                _llm_cache.popitem(last=False)
+
+    def _generate_structured_cached(
+        self,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        system_prompt: str | None,
+    ) -> Any:
+        key = self._llm_cache_key(prompt=prompt, schema=schema, system_prompt=system_prompt)
+        cached = self._llm_cache_get(key)
+        if cached is not None:
+            return cached
+        data = self.llm.generate_structured(  # type: ignore[union-attr]
+            prompt=prompt,
+            schema=schema,
+            system_prompt=system_prompt,
+            model=self.llm_model,
+        )
+        if data is not None:
+            self._llm_cache_put(key, data)
+        return data
+
+    def _generate_structured_from_media_cached(
+        self,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        media_bytes: bytes,
+        media_mime_type: str,
+        system_prompt: str | None,
+    ) -> Any:
+        key = self._llm_cache_key(
+            prompt=prompt, schema=schema, system_prompt=system_prompt, media_bytes=media_bytes
+        )
+        cached = self._llm_cache_get(key)
+        if cached is not None:
+            return cached
+        data = self.llm.generate_structured_from_media(  # type: ignore[union-attr]
+            prompt=prompt,
+            schema=schema,
+            media_bytes=media_bytes,
+            media_mime_type=media_mime_type,
+            system_prompt=system_prompt,
+            model=self.llm_model,
+        )
+        if data is not None:
+            self._llm_cache_put(key, data)
+        return data
+
+    def _generate_structured_from_media_parts_cached(
+        self,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        media_parts: list[tuple[bytes, str]],
+        system_prompt: str | None,
+    ) -> Any:
+        # Length-prefix each part so the concatenated key bytes cannot
+        # collide across different page splits.
+        media_key = b"".join(
+            len(media_bytes).to_bytes(8, "big") + media_bytes for media_bytes, _ in media_parts
+        )
+        key = self._llm_cache_key(
+            prompt=prompt, schema=schema, system_prompt=system_prompt, media_bytes=media_key
+        )
+        cached = self._llm_cache_get(key)
+        if cached is not None:
+            return cached
+        data = self.llm.generate_structured_from_media_parts(  # type: ignore[union-attr]
+            prompt=prompt,
+            schema=schema,
+            media_parts=media_parts,
+            system_prompt=system_prompt,
+            model=self.llm_model,
+        )
+        if data is not None:
+            self._llm_cache_put(key, data)
+        return data
+
     def _can_use_llm(self) -> bool:
-        if not self.llm_enabled or self.llm is None:
-            return False
-        provider = str(getattr(self.llm, "provider_name", "") or "").lower()
-        return provider != "mock"
+        return self._llm_usable
 
     def _can_use_multimodal_llm(self) -> bool:
-        if not self._can_use_llm() or self.llm is None:
-            return False
-        multimodal = getattr(self.llm, "generate_structured_from_media", None)
-        return callable(multimodal)
+        return self._llm_multimodal
 
     def _can_use_secondary_ocr(self) -> bool:
-        provider = str(getattr(self.ocr_fallback, "provider_name", "") or "").lower()
-        return provider not in {"", "mock"}
+        return self._secondary_ocr_provider not in {"", "mock"}
 
     def _extract_with_secondary_ocr(self, payload: bytes) -> tuple[str, float, str] | None:
         if not self._can_use_secondary_ocr():
             return None
-        provider = str(getattr(self.ocr_fallback, "provider_name", "") or "ocr_fallback")
+        provider = self._secondary_ocr_provider or "ocr_fallback"
         try:
             extracted = self.ocr_fallback.extract(payload)
         except Exception:
@@ -214,9 +474,26 @@ class DocumentExtractionPipeline:
         engine: str,
         questions: list[ExtractedQuestion],
     ) -> list[ExtractedQuestion] | None:
-        if not self._can_use_llm() or not raw_text.strip() or not questions:
+        # isspace() checks blankness without strip()'s full copy of raw_text.
+        if not self._can_use_llm() or not raw_text or raw_text.isspace() or not questions:
             return None
 
+        # Identical re-uploads and idempotent retries produce byte-identical
+        # raw text; the pre-split is deterministic from it, so the finished
+        # refinement can be memoized outright — skipping prompt building and
+        # response parsing, not just the network call.
+        cache_key = hashlib.blake2b(
+            f"{engine}|{source_type}|{self.llm_model or ''}|".encode() + raw_text.encode(),
+            digest_size=16,
+        ).digest()
+        with self._refine_cache_lock:
+            cached = self._refine_cache.get(cache_key)
+            if cached is not None:
+                self._refine_cache.move_to_end(cache_key)
+        if cached is not None:
+            # Callers mutate order_index/metadata downstream; hand out copies.
+            return copy.deepcopy(cached)
+
         preview = [
             {
                 "orderIndex": q.order_index,
@@ -235,7 +512,7 @@ class DocumentExtractionPipeline:
             f"sourceType={source_type}\n"
             f"engine={engine}\n"
             f"ocrRawText={raw_text[:12000]}\n"
-            f"preSplitQuestions={json.dumps(preview, ensure_ascii=False)}\n"
+            f"preSplitQuestions={orjson.dumps(preview).decode()}\n"
             "Task:\n"
             "1) Correct broken OCR text per question.\n"
             "2) Keep question order and number labels where possible.\n"
@@ -243,11 +520,10 @@ class DocumentExtractionPipeline:
         )
 
         try:
-            data = self.llm.generate_structured(
+            data = self._generate_structured_cached(
                 prompt=prompt,
                 schema=_LLM_REFINEMENT_SCHEMA,
                 system_prompt=system_prompt,
-                model=self.llm_model,
             )
         except Exception:
             return None
@@ -299,6 +575,11 @@ class DocumentExtractionPipeline:
             return None
 
         refined_questions.sort(key=lambda q: (q.order_index, q.number_label or ""))
+        with self._refine_cache_lock:
+            self._refine_cache[cache_key] = copy.deepcopy(refined_questions)
+            self._refine_cache.move_to_end(cache_key)
+            while len(self._refine_cache) > _REFINE_CACHE_MAX:
+                self._refine_cache.popitem(last=False)
         return refined_questions
 
     def _extract_pdf(self, payload: bytes) -> tuple[str, float, str] | None:
@@ -311,17 +592,46 @@ class DocumentExtractionPipeline:
             doc = fitz.open(stream=payload, filetype="pdf")
             try:
                 page_texts = [self._normalize_text(page.get_text("text")) for page in doc]
-                text = self._normalize_text("\n\n".join(item for item in page_texts if item))
+                # str.join presizes its buffer for list inputs; a generator
+                # would force element-at-a-time growth plus frame switches.
+                text = self._normalize_text("\n\n".join([item for item in page_texts if item]))
                 if text:
                     return text, 0.98, "pymupdf"
 
-                # Image-based PDF fallback: render pages then OCR each page.
+                # Image-based PDF fallback: rasterize straight to PIL images
+                # (no PNG round-trip) and OCR the pages concurrently —
+                # pytesseract blocks in a subprocess, so threads overlap.
+                try:
+                    from PIL import Image  # type: ignore
+                except Exception:
+                    return None
+
+                page_count = doc.page_count
+                # One matrix for every page; get_pixmap never mutates it.
+                render_matrix = fitz.Matrix(2, 2)
+
+                def _ocr_one(index: int) -> tuple[str, float, str] | None:
+                    # fitz documents are not thread-safe; open one per worker.
+                    local = fitz.open(stream=payload, filetype="pdf")
+                    try:
+                        pix = local[index].get_pixmap(matrix=render_matrix, alpha=False, colorspace=fitz.csRGB)
+                        # samples_mv is a zero-copy view into the pixmap
+                        # buffer; frombytes copies once instead of twice.
+                        image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples_mv)
+                    finally:
+                        local.close()
+                    return self._ocr_page_image(image)
+
+                if page_count == 1:
+                    results = [_ocr_one(0)]
+                else:
+                    max_workers = min(8, os.cpu_count() or 1, page_count)
+                    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                        results = list(executor.map(_ocr_one, range(page_count)))
+
                 ocr_page_texts: list[str] = []
                 ocr_engines: list[str] = []
-                for page in doc:
-                    pix = page.get_pixmap(matrix=fitz.Matrix(2, 2), alpha=False)
-                    page_png = pix.tobytes("png")
-                    extracted = self._extract_image(page_png)
+                for extracted in results:
                     if extracted is None:
                         continue
                     ocr_engines.append(extracted[2])
@@ -342,7 +652,13 @@ class DocumentExtractionPipeline:
             return None
 
     @staticmethod
-    def _preprocess_image(payload: bytes) -> bytes:
+    def _preprocess_image(payload: bytes):
+        """Decode and denoise for OCR.
+
+        Returns a grayscale ndarray so downstream consumers work on raw
+        pixels instead of paying a PNG encode/decode round-trip; falls back
+        to the original bytes when OpenCV is unavailable or decoding fails.
+        """
         try:
             import cv2  # type: ignore
             import numpy as np  # type: ignore
@@ -356,45 +672,152 @@ class DocumentExtractionPipeline:
                 return payload
 
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            denoised = cv2.medianBlur(gray, 3)
-            _, encoded = cv2.imencode(".png", denoised)
-            if not encoded.any():
-                return payload
-            return encoded.tobytes()
+            if cv2.Laplacian(gray, cv2.CV_64F).var() > _SHARPNESS_SKIP_THRESHOLD:
+                return gray
+            return cv2.medianBlur(gray, 3)
         except Exception:
             return payload
 
-    def _extract_image(self, payload: bytes) -> tuple[str, float, str] | None:
-        processed = self._preprocess_image(payload)
+    @staticmethod
+    def _encode_preprocessed(processed) -> bytes | None:
+        """Encode a preprocessed ndarray for consumers that need bytes."""
+        if isinstance(processed, (bytes, bytearray)):
+            return bytes(processed)
+        try:
+            import cv2  # type: ignore
+        except Exception:
+            return None
+        try:
+            ok, encoded = cv2.imencode(".png", processed)
+            return encoded.tobytes() if ok else None
+        except Exception:
+            return None
 
-        # If a stronger OCR adapter is configured (e.g., Google Vision),
-        # try it first for better robustness on noisy scans.
-        secondary = self._extract_with_secondary_ocr(processed)
-        if secondary is not None:
-            return secondary
+    def _tesserocr_api(self):
+        """Return this thread's in-process Tesseract engine, if available.
 
+        ``tesserocr`` keeps the engine initialized between pages, avoiding
+        the per-call process spawn and temp-file round-trip pytesseract
+        incurs. It is optional; ``None`` means fall back to pytesseract.
+        """
+        if getattr(_tesserocr_local, "lang", None) == self.ocr_lang:
+            return _tesserocr_local.api
         try:
-            from PIL import Image  # type: ignore
-            import pytesseract  # type: ignore
+            from tesserocr import OEM, PSM, PyTessBaseAPI  # type: ignore
+
+            api = PyTessBaseAPI(lang=self.ocr_lang, oem=OEM.LSTM_ONLY, psm=PSM.SINGLE_BLOCK)
         except Exception:
-            return self._extract_with_secondary_ocr(processed)
+            api = None
+        _tesserocr_local.api = api
+        _tesserocr_local.lang = self.ocr_lang
+        return api
+
+    def _tesseract_ocr(self, image) -> str | None:
+        """Run local Tesseract on a PIL image, in-process when possible."""
+        api = self._tesserocr_api()
+        if api is not None:
+            try:
+                api.SetImage(image)
+                text = self._normalize_text(api.GetUTF8Text())
+                if text:
+                    return text
+            except Exception:
+                pass
 
         try:
-            image = Image.open(io.BytesIO(processed))
+            import pytesseract  # type: ignore
+        except Exception:
+            return None
+        try:
             text = self._normalize_text(
                 pytesseract.image_to_string(
                     image,
                     lang=self.ocr_lang,
                     config="--oem 1 --psm 6",
+                    timeout=_TESSERACT_TIMEOUT,
                 )
             )
             if not text:
-                text = self._normalize_text(pytesseract.image_to_string(image))
+                text = self._normalize_text(
+                    pytesseract.image_to_string(image, timeout=_TESSERACT_TIMEOUT)
+                )
+            return text or None
+        except Exception:
+            return None
+
+    @staticmethod
+    def _preprocess_pil_image(image):
+        """Grayscale + denoise an already-decoded page image for OCR.
+
+        Mirror of :meth:`_preprocess_image` for the fused render→OCR
+        path, which never has encoded bytes in hand; pages that pass the
+        sharpness check skip the blur.
+        """
+        try:
+            import cv2  # type: ignore
+            import numpy as np  # type: ignore
+            from PIL import Image  # type: ignore
+        except Exception:
+            return image
+
+        try:
+            gray = cv2.cvtColor(np.asarray(image), cv2.COLOR_RGB2GRAY)
+            if cv2.Laplacian(gray, cv2.CV_64F).var() <= _SHARPNESS_SKIP_THRESHOLD:
+                gray = cv2.medianBlur(gray, 3)
+            return Image.fromarray(gray)
+        except Exception:
+            return image
+
+    def _ocr_page_image(self, image) -> tuple[str, float, str] | None:
+        """OCR one already-rendered page image without re-encoding it."""
+        image = self._preprocess_pil_image(image)
+        if self._can_use_secondary_ocr():
+            # Remote providers need encoded bytes; everything else stays raw.
+            secondary = self._extract_with_secondary_ocr(QuestionCropper._encode_png(image))
+            if secondary is not None:
+                return secondary
+
+        text = self._tesseract_ocr(image)
+        if not text:
+            return None
+        return text, 0.82, "pytesseract"
+
+    def _extract_image(self, payload: bytes) -> tuple[str, float, str] | None:
+        processed = self._preprocess_image(payload)
+
+        encoded: bytes | None = None
+
+        def _secondary() -> tuple[str, float, str] | None:
+            # Remote providers need encoded bytes; encode lazily, at most once.
+            nonlocal encoded
+            if not self._can_use_secondary_ocr():
+                return None
+            if encoded is None:
+                encoded = self._encode_preprocessed(processed) or payload
+            return self._extract_with_secondary_ocr(encoded)
+
+        # If a stronger OCR adapter is configured (e.g., Google Vision),
+        # try it first for better robustness on noisy scans.
+        secondary = _secondary()
+        if secondary is not None:
+            return secondary
+
+        try:
+            from PIL import Image  # type: ignore
+        except Exception:
+            return _secondary()
+
+        try:
+            if isinstance(processed, (bytes, bytearray)):
+                image = Image.open(io.BytesIO(processed))
+            else:
+                image = Image.fromarray(processed)
+            text = self._tesseract_ocr(image)
             if not text:
-                return self._extract_with_secondary_ocr(processed)
+                return _secondary()
             return text, 0.82, "pytesseract"
         except Exception:
-            return self._extract_with_secondary_ocr(processed)
+            return _secondary()
 
     def _extract_with_fallback(self, payload: bytes) -> tuple[str, float, str]:
         extracted = self.ocr_fallback.extract(payload)
@@ -429,8 +852,14 @@ class DocumentExtractionPipeline:
             raise RuntimeError("Pillow is not available")
 
         work = image.convert("RGB")
-        max_side = 2200
         quality = 85
+        # Q85 JPEG of scan-like content averages roughly 0.15 bytes/pixel;
+        # size the first attempt from that so the shrink loop almost never
+        # has to re-encode.
+        est_scale = (_MAX_GEMINI_MEDIA_BYTES / (0.15 * work.width * work.height)) ** 0.5
+        max_side = 2200
+        if est_scale < 1.0:
+            max_side = min(max_side, max(900, int(max(work.width, work.height) * est_scale)))
         resampling = getattr(getattr(Image, "Resampling", Image), "LANCZOS")
 
         while True:
@@ -466,7 +895,10 @@ class DocumentExtractionPipeline:
 
         processed = self._preprocess_image(payload)
         try:
-            image = Image.open(io.BytesIO(processed)).convert("RGB")
+            if isinstance(processed, (bytes, bytearray)):
+                image = Image.open(io.BytesIO(processed)).convert("RGB")
+            else:
+                image = Image.fromarray(processed).convert("RGB")
         except Exception:
             return None
         return self._encode_compact_image(image)
@@ -490,13 +922,12 @@ class DocumentExtractionPipeline:
             "Do not summarize."
         )
         try:
-            data = self.llm.generate_structured_from_media(
+            data = self._generate_structured_from_media_cached(
                 prompt=prompt,
                 schema=_LLM_MEDIA_RAW_TEXT_SCHEMA,
                 media_bytes=media_bytes,
                 media_mime_type=media_mime_type,
                 system_prompt=system_prompt,
-                model=self.llm_model,
             )
         except Exception as exc:
             raise RuntimeError(f"Gemini raw-text fallback failed: {exc}") from exc
@@ -556,37 +987,60 @@ class DocumentExtractionPipeline:
 
         _MIN_HEIGHT_RATIO = 0.05
 
-        for q in questions:
-            hint = (q.metadata or {}).get("cropHint")
-            if not isinstance(hint, dict):
-                continue
-            top = hint.get("topRatio", 0)
-            bottom = hint.get("bottomRatio", 0)
-            height = bottom - top
-            if 0 < height < _MIN_HEIGHT_RATIO:
-                mid = (top + bottom) / 2
-                hint["topRatio"] = round(max(0.0, mid - _MIN_HEIGHT_RATIO / 2), 5)
-                hint["bottomRatio"] = round(min(1.0, mid + _MIN_HEIGHT_RATIO / 2), 5)
-
+        # Expand too-short hints; masks and clamps run vectorized over the
+        # hinted subset, with only the few flagged dicts written back.
+        hinted = [
+            hint
+            for q in questions
+            if isinstance(hint := (q.metadata or {}).get("cropHint"), dict)
+        ]
+        if hinted:
+            tops = np.array([hint.get("topRatio", 0) for hint in hinted], dtype=np.float64)
+            bottoms = np.array([hint.get("bottomRatio", 0) for hint in hinted], dtype=np.float64)
+            heights = bottoms - tops
+            short = (heights > 0) & (heights < _MIN_HEIGHT_RATIO)
+            if short.any():
+                mids = (tops + bottoms) / 2
+                # tolist() converts to Python floats in one C pass instead
+                # of boxing each element on indexing.
+                new_tops = np.round(np.maximum(0.0, mids - _MIN_HEIGHT_RATIO / 2), 5).tolist()
+                new_bottoms = np.round(np.minimum(1.0, mids + _MIN_HEIGHT_RATIO / 2), 5).tolist()
+                for i in np.flatnonzero(short).tolist():
+                    hinted[i]["topRatio"] = new_tops[i]
+                    hinted[i]["bottomRatio"] = new_bottoms[i]
+
+        # Column buckets + a sort by topRatio keep the overlap fix at
+        # O(N log N): each hint is only ever compared to its predecessor
+        # in the same column, never all pairs.
         col_key = DocumentExtractionPipeline._column_key
         by_col: dict[str, list[ExtractedQuestion]] = {"full": [], "left": [], "right": []}
         for q in questions:
-            by_col.setdefault(col_key(q), []).append(q)
+            by_col[col_key(q)].append(q)
 
         sort_by_top = lambda q: (q.metadata or {}).get("cropHint", {}).get("topRatio", 0)
         for group in by_col.values():
+            if len(group) < 2:
+                continue
             group.sort(key=sort_by_top)
-            for i in range(1, len(group)):
-                prev_hint = (group[i - 1].metadata or {}).get("cropHint")
-                curr_hint = (group[i].metadata or {}).get("cropHint")
-                if not isinstance(prev_hint, dict) or not isinstance(curr_hint, dict):
-                    continue
-                prev_bottom = prev_hint.get("bottomRatio", 0)
-                curr_top = curr_hint.get("topRatio", 0)
-                if curr_top < prev_bottom:
-                    midpoint = (prev_bottom + curr_top) / 2
-                    prev_hint["bottomRatio"] = round(midpoint, 5)
-                    curr_hint["topRatio"] = round(midpoint, 5)
+            # Neighbouring overlaps split at the midpoint. Each adjustment
+            # touches prev.bottom and curr.top only, so no fix feeds into a
+            # later comparison and the masked update matches the old loop.
+            hints = [(q.metadata or {}).get("cropHint") for q in group]
+            tops = np.array(
+                [hint.get("topRatio", 0) if isinstance(hint, dict) else np.nan for hint in hints],
+                dtype=np.float64,
+            )
+            bottoms = np.array(
+                [hint.get("bottomRatio", 0) if isinstance(hint, dict) else np.nan for hint in hints],
+                dtype=np.float64,
+            )
+            overlap = tops[1:] < bottoms[:-1]
+            if not overlap.any():
+                continue
+            mids = np.round((bottoms[:-1] + tops[1:]) / 2, 5).tolist()
+            for i in np.flatnonzero(overlap).tolist():
+                hints[i]["bottomRatio"] = mids[i]
+                hints[i + 1]["topRatio"] = mids[i]
 
         reordered = by_col.get("full", []) + by_col.get("left", []) + by_col.get("right", [])
         for idx, q in enumerate(reordered, start=1):
@@ -611,32 +1065,16 @@ class DocumentExtractionPipeline:
         prompt = (
             f"pageIndex={page_index}\n"
             "Parse this Korean exam sheet into per-question records.\n"
-            "Rules:\n"
-            "1) Detect the page layout: single-column or two-column.\n"
-            "2) For two-column layouts, process in reading order: "
-            "left column top-to-bottom first, then right column top-to-bottom.\n"
-            "3) Keep numberLabel exactly as visible.\n"
-            "4) text must contain the full question body and all options.\n"
-            "5) confidence is 0~1.\n"
-            "6) cropTopRatio/cropBottomRatio are normalized vertical positions (0~1) "
-            "on this single page image. They must tightly enclose only that question.\n"
-            "7) cropLeftRatio/cropRightRatio are normalized horizontal positions (0~1). "
-            "Left-column questions: cropLeftRatio~0.0, cropRightRatio~0.5. "
-            "Right-column questions: cropLeftRatio~0.5, cropRightRatio~1.0. "
-            "Full-width questions (headers, single-column): cropLeftRatio=0.0, cropRightRatio=1.0.\n"
-            "8) Crop regions must NOT overlap between questions.\n"
-            "9) If any crop ratio is uncertain, return null for that field.\n"
-            "10) If metadata cannot be inferred, use 'unknown'."
+            f"{_MEDIA_PROMPT_RULES}"
         )
 
         try:
-            data = self.llm.generate_structured_from_media(
+            data = self._generate_structured_from_media_cached(
                 prompt=prompt,
                 schema=_LLM_MEDIA_EXTRACTION_SCHEMA,
                 media_bytes=media_bytes,
                 media_mime_type=media_mime_type,
                 system_prompt=system_prompt,
-                model=self.llm_model,
             )
         except Exception as exc:
             try:
@@ -662,6 +1100,24 @@ class DocumentExtractionPipeline:
                 page_index=page_index,
             )
 
+        questions, raw_chunks = self._questions_from_media_items(
+            items, source_type=source_type, page_index=page_index
+        )
+        if not questions:
+            raise RuntimeError("structured extraction returned no valid question payloads.")
+
+        questions = self._postprocess_crop_hints(questions)
+        raw_text = self._normalize_text("\n\n".join(raw_chunks))
+        return questions, raw_text
+
+    def _questions_from_media_items(
+        self,
+        items: list,
+        *,
+        source_type: str,
+        page_index: int,
+    ) -> tuple[list[ExtractedQuestion], list[str]]:
+        """Parse structured media-extraction items for one page."""
         questions: list[ExtractedQuestion] = []
         raw_chunks: list[str] = []
         for idx, item in enumerate(items, start=1):
@@ -727,12 +1183,118 @@ class DocumentExtractionPipeline:
             )
             raw_chunks.append(text)
 
-        if not questions:
-            raise RuntimeError("structured extraction returned no valid question payloads.")
+        return questions, raw_chunks
 
-        questions = self._postprocess_crop_hints(questions)
-        raw_text = self._normalize_text("\n\n".join(raw_chunks))
-        return questions, raw_text
+    def _extract_with_gemini_media_batch(
+        self,
+        batch: list[tuple[int, bytes, str]],
+        *,
+        source_type: str,
+    ) -> list[tuple[list[ExtractedQuestion], str]]:
+        """Extract several pages with one multi-image LLM call.
+
+        ``batch`` holds ``(page_index, media_bytes, media_mime_type)``
+        tuples. Pages the model skips or returns empty fall back to the
+        per-page call. Results come back in batch order.
+        """
+        if self.llm is None:
+            raise RuntimeError("gemini_full mode requires a multimodal LLM backend.")
+
+        page_indexes = [page_index for page_index, _, _ in batch]
+        system_prompt = (
+            "You are an exam parsing engine. Read the attached document images and "
+            "return strict JSON only according to schema."
+        )
+        prompt = (
+            f"pageIndexes={','.join(str(page_index) for page_index in page_indexes)}\n"
+            "The attached images are exam pages in the order listed above.\n"
+            "Parse every page into per-question records, grouped under its pageIndex.\n"
+            f"{_MEDIA_PROMPT_RULES}"
+        )
+
+        data = self._generate_structured_from_media_parts_cached(
+            prompt=prompt,
+            schema=_LLM_MEDIA_BATCH_EXTRACTION_SCHEMA,
+            media_parts=[(media_bytes, mime) for _, media_bytes, mime in batch],
+            system_prompt=system_prompt,
+        )
+
+        by_page: dict[int, list] = {}
+        entries = data.get("pages") if isinstance(data, dict) else None
+        if isinstance(entries, list):
+            for entry in entries:
+                if isinstance(entry, dict) and isinstance(entry.get("questions"), list):
+                    by_page[self._to_int(entry.get("pageIndex"), 0)] = entry["questions"]
+
+        results: list[tuple[list[ExtractedQuestion], str]] = []
+        for page_index, media_bytes, mime in batch:
+            questions, raw_chunks = self._questions_from_media_items(
+                by_page.get(page_index) or [], source_type=source_type, page_index=page_index
+            )
+            if not questions:
+                results.append(
+                    self._extract_with_gemini_media(
+                        media_bytes=media_bytes,
+                        media_mime_type=mime,
+                        source_type=source_type,
+                        page_index=page_index,
+                    )
+                )
+                continue
+            questions = self._postprocess_crop_hints(questions)
+            results.append((questions, self._normalize_text("\n\n".join(raw_chunks))))
+        return results
+
+    def _prepare_page_media(self, page_item) -> tuple[bytes, str]:
+        """Normalize a rendered page (bytes tuple or PIL image) for the LLM."""
+        if isinstance(page_item, tuple):
+            media_bytes, media_mime_type = page_item
+            if len(media_bytes) > _MAX_GEMINI_MEDIA_BYTES:
+                # Oversized fused encode: shrink through the compact
+                # encoder instead.
+                from PIL import Image  # type: ignore
+
+                media_bytes, media_mime_type = self._encode_compact_image(
+                    Image.open(io.BytesIO(media_bytes))
+                )
+            return media_bytes, media_mime_type
+        return self._encode_compact_image(page_item)
+
+    @staticmethod
+    def _render_pages_jpeg(
+        payload: bytes,
+        *,
+        max_side: int = 2200,
+        quality: int = 85,
+    ) -> list[tuple[bytes, str]] | None:
+        """Rasterize PDF pages straight to JPEG bytes.
+
+        Fuses render and encode: fitz renders at the target size and encodes
+        the pixmap directly, so the intermediate PIL image plus the
+        resize/re-encode cycle in _encode_compact_image never materialize.
+        """
+        try:
+            import fitz  # type: ignore
+        except Exception:
+            return None
+
+        try:
+            doc = fitz.open(stream=payload, filetype="pdf")
+        except Exception:
+            return None
+        try:
+            encoded: list[tuple[bytes, str]] = []
+            for page in doc:
+                rect = page.rect
+                longest = max(rect.width, rect.height) or 1.0
+                zoom = min(2.0, max_side / longest)
+                pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False, colorspace=fitz.csRGB)
+                encoded.append((pix.pil_tobytes(format="JPEG", quality=quality), "image/jpeg"))
+            return encoded or None
+        except Exception:
+            return None
+        finally:
+            doc.close()
 
     def _extract_with_gemini_full(
         self,
@@ -746,25 +1308,89 @@ class DocumentExtractionPipeline:
 
         source_type = self._media_source_type(content_type, filename)
         all_questions: list[ExtractedQuestion] = []
-        raw_chunks: list[str] = []
+        # Page texts stream into one growable buffer instead of a list of
+        # strings plus a join copy at the end; futures are consumed in page
+        # order, so writes land in order too.
+        raw_buf = io.StringIO()
 
         if source_type == "pdf":
-            pages = QuestionCropper._render_pages(payload=payload, content_type=content_type, filename=filename)
+            pages: list = self._render_pages_jpeg(payload) or []
+            if not pages:
+                pages = QuestionCropper._render_pages(payload=payload, content_type=content_type, filename=filename)
             if not pages:
                 raise RuntimeError("gemini_page_extract_failed(page=0): could not render PDF pages.")
-            for page_idx, page_image in enumerate(pages, start=1):
-                try:
-                    media_bytes, media_mime_type = self._encode_compact_image(page_image)
-                    page_questions, raw_text = self._extract_with_gemini_media(
-                        media_bytes=media_bytes,
-                        media_mime_type=media_mime_type,
-                        source_type=source_type,
-                        page_index=page_idx,
-                    )
-                except Exception as exc:
-                    raise RuntimeError(f"gemini_page_extract_failed(page={page_idx}): {exc}") from exc
-                all_questions.extend(page_questions)
-                raw_chunks.append(raw_text)
+
+            # Repeated pages (blank sheets, answer templates) encode to the
+            # same bytes; reuse the first extraction instead of paying for
+            # another API round-trip. Best effort under concurrency: two
+            # identical pages racing both miss and both call out.
+            page_cache: dict[bytes, tuple[list[ExtractedQuestion], str]] = {}
+            page_cache_lock = threading.Lock()
+
+            def _extract_page(
+                page_idx: int, media_bytes: bytes, media_mime_type: str
+            ) -> tuple[list[ExtractedQuestion], str]:
+                digest = hashlib.blake2b(media_bytes, digest_size=16).digest()
+                with page_cache_lock:
+                    cached = page_cache.get(digest)
+                if cached is not None:
+                    page_questions, raw_text = copy.deepcopy(cached)
+                    for question in page_questions:
+                        question.metadata["pageIndex"] = page_idx
+                        hint = question.metadata.get("cropHint")
+                        if isinstance(hint, dict):
+                            hint["pageIndex"] = page_idx
+                    return page_questions, raw_text
+                result = self._extract_with_gemini_media(
+                    media_bytes=media_bytes,
+                    media_mime_type=media_mime_type,
+                    source_type=source_type,
+                    page_index=page_idx,
+                )
+                with page_cache_lock:
+                    page_cache[digest] = copy.deepcopy(result)
+                return result
+
+            def _extract_group(group: list[tuple[int, Any]]) -> list[tuple[list[ExtractedQuestion], str]]:
+                prepared = [
+                    (page_idx, *self._prepare_page_media(page_item)) for page_idx, page_item in group
+                ]
+                if len(prepared) > 1:
+                    try:
+                        return self._extract_with_gemini_media_batch(prepared, source_type=source_type)
+                    except Exception:
+                        # Batched call unsupported or rejected; the per-page
+                        # path below remains the authoritative fallback.
+                        pass
+                return [
+                    _extract_page(page_idx, media_bytes, media_mime_type)
+                    for page_idx, media_bytes, media_mime_type in prepared
+                ]
+
+            batch_size = max(1, self.pages_per_call)
+            indexed = list(enumerate(pages, start=1))
+            groups = [indexed[i : i + batch_size] for i in range(0, len(indexed), batch_size)]
+
+            # Each group is an independent network round-trip; run them
+            # concurrently and collect in page order.
+            with ThreadPoolExecutor(max_workers=min(self.page_concurrency, len(groups))) as executor:
+                futures = [executor.submit(_extract_group, group) for group in groups]
+                for group, future in zip(groups, futures):
+                    try:
+                        group_results = future.result()
+                    except Exception as exc:
+                        raise RuntimeError(
+                            f"gemini_page_extract_failed(page={group[0][0]}): {exc}"
+                        ) from exc
+                    for page_questions, raw_text in group_results:
+                        # Pages land in render order, so sorting each
+                        # page's questions here keeps the whole list
+                        # ordered without a global document-wide sort.
+                        page_questions.sort(key=_page_order_key)
+                        all_questions.extend(page_questions)
+                        if raw_text:
+                            raw_buf.write(raw_text)
+                            raw_buf.write("\n\n")
         elif source_type == "image":
             prepared = self._prepare_image_media_for_llm(payload=payload)
             if prepared is None:
@@ -776,27 +1402,29 @@ class DocumentExtractionPipeline:
                 source_type=source_type,
                 page_index=1,
             )
+            page_questions.sort(key=_page_order_key)
             all_questions.extend(page_questions)
-            raw_chunks.append(raw_text)
+            if raw_text:
+                raw_buf.write(raw_text)
+                raw_buf.write("\n\n")
         else:
             raise RuntimeError("gemini_extract_failed: unsupported media type for gemini_full.")
 
         if not all_questions:
             raise RuntimeError("gemini_extract_failed: no questions extracted.")
 
-        all_questions.sort(
-            key=lambda q: (
-                int((q.metadata or {}).get("pageIndex") or 0),
-                int(q.order_index or 0),
-                str(q.number_label or ""),
-            )
-        )
         for idx, question in enumerate(all_questions, start=1):
             question.order_index = idx
             if not question.number_label:
                 question.number_label = str(idx)
 
-        engines = {str((item.metadata or {}).get("engine") or "") for item in all_questions}
+        # Only singleton-vs-mixed matters below, so stop scanning as soon
+        # as a second engine shows up.
+        engines: set[str] = set()
+        for item in all_questions:
+            engines.add(str((item.metadata or {}).get("engine") or ""))
+            if len(engines) >= 2:
+                break
         if source_type == "pdf":
             if engines == {"gemini_vision"}:
                 engine = "gemini_vision_pages"
@@ -811,7 +1439,10 @@ class DocumentExtractionPipeline:
                 engine = "gemini_vision_text"
             else:
                 engine = "gemini_vision_mixed"
-        raw_text = self._normalize_text("\n\n".join(chunk for chunk in raw_chunks if chunk))
+        # Every producer returns text already normalized (LF-only,
+        # stripped), so the join is normalized by construction and only
+        # the trailing separator written after the last chunk remains.
+        raw_text = raw_buf.getvalue()[:-2]
         return all_questions, engine, raw_text, source_type
 
     def extract(
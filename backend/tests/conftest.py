@@ -1,12 +1,17 @@
 import os
 import sys
+import tempfile
 from pathlib import Path
 
+import pytest
+
 
 # Keep tests deterministic and local-only.
 os.environ["SEDU_SKIP_DOTENV"] = "1"
 os.environ["SEDU_STORAGE_BACKEND"] = "local"
-os.environ["SEDU_UPLOAD_DIR"] = "backend/test_uploads"
+# A fresh temp dir per run: a relative path here resolves against the
+# CWD and litters the repo with binary upload artifacts.
+os.environ["SEDU_UPLOAD_DIR"] = tempfile.mkdtemp(prefix="sedu_test_uploads_")
 os.environ["SEDU_OCR_BACKEND"] = "mock"
 os.environ["SEDU_LLM_BACKEND"] = "mock"
 os.environ["SEDU_EXTRACTION_MODE"] = "hybrid"
@@ -19,7 +24,33 @@ BACKEND_ROOT = Path(__file__).resolve().parents[1]
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
-TEST_DB_PATH = BACKEND_ROOT / "test_sedu_v2.db"
-os.environ["DATABASE_URL"] = f"sqlite:///{TEST_DB_PATH}"
-if TEST_DB_PATH.exists():
-    TEST_DB_PATH.unlink()
+# Shared-cache in-memory SQLite: no file, no fsync, and every connection
+# in the process sees the same data (which the persistence test relies
+# on). Being per-process it also isolates pytest-xdist workers for free.
+os.environ["DATABASE_URL"] = "sqlite:///file:sedu_test?mode=memory&cache=shared&uri=true"
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One app client (and one lifespan startup) for the whole session.
+
+    Imports happen lazily so the env setup above runs before the app
+    module reads it.
+    """
+    from app.main import app
+    from tests.http_client import SyncASGIClient
+
+    with SyncASGIClient(app) as shared_client:
+        yield shared_client
+
+
+@pytest.fixture(scope="session")
+def openapi_schema():
+    """The app's OpenAPI document, materialized once per session.
+
+    app.openapi() walks every route and resolves every model; the result
+    is deterministic for the process lifetime.
+    """
+    from app.main import app
+
+    return app.openapi()
@@ -1,25 +1,74 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 from typing import Any
 
 import httpx
 
 
 class SyncASGIClient:
+    """Synchronous facade over httpx's ASGI transport.
+
+    The event loop, transport, client and lifespan context are created
+    lazily on the first request and reused for the client's lifetime —
+    building them per request costs more than the requests themselves
+    across a test suite.
+    """
+
     def __init__(self, app, base_url: str = "http://testserver"):
         self._app = app
         self._base_url = base_url
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._client: httpx.AsyncClient | None = None
+        self._lifespan = None
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self._loop is not None:
+            return self._loop
+        loop = asyncio.new_event_loop()
+        transport = httpx.ASGITransport(app=self._app)
+        client = httpx.AsyncClient(transport=transport, base_url=self._base_url)
+        # ASGITransport does not emit lifespan events; run them ourselves
+        # so startup work (e.g. init_db) happens like under uvicorn.
+        lifespan = self._app.router.lifespan_context(self._app)
+        loop.run_until_complete(lifespan.__aenter__())
+        self._loop = loop
+        self._client = client
+        self._lifespan = lifespan
+        atexit.register(self.close)
+        return loop
+
+    def close(self) -> None:
+        if self._loop is None:
+            return
+        loop, client, lifespan = self._loop, self._client, self._lifespan
+        self._loop = None
+        self._client = None
+        self._lifespan = None
+        try:
+            if client is not None:
+                loop.run_until_complete(client.aclose())
+            if lifespan is not None:
+                loop.run_until_complete(lifespan.__aexit__(None, None, None))
+        finally:
+            loop.close()
+
+    def __enter__(self) -> "SyncASGIClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        loop = self._ensure_started()
+
         async def _run() -> httpx.Response:
-            transport = httpx.ASGITransport(app=self._app)
-            async with httpx.AsyncClient(transport=transport, base_url=self._base_url) as client:
-                response = await client.request(method, url, **kwargs)
-                await response.aread()
-                return response
+            response = await self._client.request(method, url, **kwargs)
+            await response.aread()
+            return response
 
-        return asyncio.run(_run())
+        return loop.run_until_complete(_run())
 
     def get(self, url: str, **kwargs: Any) -> httpx.Response:
         return self.request("GET", url, **kwargs)
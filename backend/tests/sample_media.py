@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import io
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def png_bytes(width: int, height: int, texts: tuple[tuple[int, int, str], ...] = ()) -> bytes:
+    """White PNG with optional text lines, encoded once per unique shape.
+
+    PNG encoding is the dominant cost of the image-driven tests and the
+    payloads are immutable, so every caller with the same arguments
+    shares one cached copy.
+    """
+    from PIL import Image, ImageDraw
+
+    image = Image.new("RGB", (width, height), "white")
+    if texts:
+        draw = ImageDraw.Draw(image)
+        for x, y, text in texts:
+            draw.text((x, y), text, fill="black")
+    buf = io.BytesIO()
+    # Mostly-white fixtures compress trivially; the default deflate level
+    # only burns CPU for bytes nobody stores.
+    image.save(buf, format="PNG", compress_level=1, optimize=False)
+    return buf.getvalue()
+
+
+@lru_cache(maxsize=None)
+def scanned_pdf_bytes(page_labels: tuple[str | None, ...], width: int = 900, height: int = 600) -> bytes:
+    """Image-only PDF with one page per label (None means a blank page).
+
+    Page images are decoded to a Pixmap once per distinct label and the
+    pixmap is reused; passing raw PNG bytes would make MuPDF re-decode
+    the stream for every page it appears on.
+    """
+    import fitz  # type: ignore
+
+    pdf = fitz.open()
+    rect = fitz.Rect(20, 20, width - 20, height - 20)
+    pixmaps: dict[str | None, fitz.Pixmap] = {}
+    for label in page_labels:
+        pix = pixmaps.get(label)
+        if pix is None:
+            texts = ((40, 40, label),) if label else ()
+            pix = fitz.Pixmap(png_bytes(width, height, texts))
+            pixmaps[label] = pix
+        page = pdf.new_page(width=width, height=height)
+        page.insert_image(rect, pixmap=pix)
+    pixmaps.clear()
+    payload = pdf.tobytes()
+    pdf.close()
+    return payload
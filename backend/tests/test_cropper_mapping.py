@@ -1,7 +1,8 @@
+from app.infra.ports.storage import StoragePort
 from app.workers.extraction.cropper import QuestionCropper
 
 
-class DummyStorage:
+class DummyStorage(StoragePort):
     def save_bytes(self, key: str, data: bytes, content_type: str | None) -> str:
         return f"/uploads/{key}"
 
@@ -87,7 +88,7 @@ def test_create_and_store_falls_back_to_order_when_labels_unreliable(monkeypatch
 
     monkeypatch.setattr(cropper, "_render_canvas", lambda **_kwargs: DummyCanvas())
     monkeypatch.setattr(cropper, "_detect_question_starts", lambda _image: [(100, 1), (320, 2), (640, 3)])
-    monkeypatch.setattr(cropper, "_encode_png", lambda _image: b"png")
+    monkeypatch.setattr(cropper, "_encode_jpeg", lambda _image: b"jpg")
 
     def fake_normalize_ranges(*, height: int, count: int, starts: list[int] | None = None):
         captured["starts"] = starts
@@ -153,7 +154,7 @@ def test_create_and_store_with_trace_uses_page_hints_first(monkeypatch):
 
     cropper = QuestionCropper(storage=DummyStorage(), secondary_ocr=DummyVisionOCR())
     monkeypatch.setattr(cropper, "_render_pages", lambda **_kwargs: [DummyPage(), DummyPage()])
-    monkeypatch.setattr(cropper, "_encode_png", lambda _image: b"png")
+    monkeypatch.setattr(cropper, "_encode_jpeg", lambda _image: b"jpg")
 
     traces = cropper.create_and_store_with_trace(
         set_id="set_1",
@@ -1,7 +1,9 @@
+from app.infra.db.session import init_db
 from app.infra.db.store import DatabaseStore
 
 
 def test_database_store_persists_across_instances():
+    init_db()
     first = DatabaseStore()
     created = first.create_document(filename="persist.pdf", mime="application/pdf", size=128)
 
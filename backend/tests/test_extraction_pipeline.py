@@ -1,44 +1,75 @@
 from __future__ import annotations
 
-import pytest
+import threading
 from typing import Any
 
+import pytest
+
 from app.workers.extraction import DocumentExtractionPipeline
+from tests.sample_media import png_bytes, scanned_pdf_bytes
+
+
+# Stub responses are immutable fixtures; building them once at module
+# scope keeps the stub call paths allocation-free.
+_STRUCTURED_RESPONSE = {
+    "questions": [
+        {
+            "orderIndex": 1,
+            "numberLabel": "1",
+            "text": "1. LLM이 보정한 문제 본문",
+            "confidence": 0.93,
+            "subject": "science",
+            "unit": "화학",
+            "difficulty": "middle",
+            "questionType": "multiple_choice",
+            "answerFormat": "single_choice",
+        }
+    ]
+}
+
+_MEDIA_RESPONSE = {
+    "questions": [
+        {
+            "orderIndex": 1,
+            "numberLabel": "1",
+            "text": "1. Gemini가 문서를 직접 읽은 문제",
+            "confidence": 0.95,
+            "subject": "science",
+            "unit": "화학",
+            "difficulty": "middle",
+            "questionType": "multiple_choice",
+            "answerFormat": "single_choice",
+            "cropTopRatio": 0.1,
+            "cropBottomRatio": 0.45,
+        }
+    ]
+}
+
+_VISION_OCR_RESPONSE = {
+    "text": "1. Vision OCR first pass text",
+    "confidence": 0.89,
+    "tokens": [],
+}
 
 
 class StubOCR:
     def __init__(self, text: str, confidence: float = 0.8):
-        self._text = text
-        self._confidence = confidence
-
-    def extract(self, image_bytes: bytes) -> dict[str, Any]:
-        return {
-            "text": self._text,
-            "confidence": self._confidence,
+        self._response = {
+            "text": text,
+            "confidence": confidence,
             "tokens": [],
         }
 
+    def extract(self, image_bytes: bytes) -> dict[str, Any]:
+        return self._response
+
 
 class StubLLM:
     provider_name = "gemini"
     model_name = "gemini-test"
 
     def generate_structured(self, *, prompt: str, schema: dict[str, Any], system_prompt: str | None = None, model: str | None = None):
-        return {
-            "questions": [
-                {
-                    "orderIndex": 1,
-                    "numberLabel": "1",
-                    "text": "1. LLM이 보정한 문제 본문",
-                    "confidence": 0.93,
-                    "subject": "science",
-                    "unit": "화학",
-                    "difficulty": "middle",
-                    "questionType": "multiple_choice",
-                    "answerFormat": "single_choice",
-                }
-            ]
-        }
+        return _STRUCTURED_RESPONSE
 
     def generate_structured_from_media(
         self,
@@ -50,34 +81,14 @@ class StubLLM:
         system_prompt: str | None = None,
         model: str | None = None,
     ):
-        return {
-            "questions": [
-                {
-                    "orderIndex": 1,
-                    "numberLabel": "1",
-                    "text": "1. Gemini가 문서를 직접 읽은 문제",
-                    "confidence": 0.95,
-                    "subject": "science",
-                    "unit": "화학",
-                    "difficulty": "middle",
-                    "questionType": "multiple_choice",
-                    "answerFormat": "single_choice",
-                    "cropTopRatio": 0.1,
-                    "cropBottomRatio": 0.45,
-                }
-            ]
-        }
+        return _MEDIA_RESPONSE
 
 
 class StubVisionOCR:
     provider_name = "google_vision"
 
     def extract(self, image_bytes: bytes) -> dict[str, Any]:
-        return {
-            "text": "1. Vision OCR first pass text",
-            "confidence": 0.89,
-            "tokens": [],
-        }
+        return _VISION_OCR_RESPONSE
 
 
 class StubLLMEmptyStructuredThenRaw:
@@ -85,22 +96,15 @@ class StubLLMEmptyStructuredThenRaw:
     model_name = "gemini-test"
 
     def __init__(self):
-        self.call_count = 0
+        self._responses = iter(
+            [
+                {"questions": []},
+                {"rawText": "1. 원문 추출\n2. 두번째 문제"},
+            ]
+        )
 
-    def generate_structured_from_media(
-        self,
-        *,
-        prompt: str,
-        schema: dict[str, Any],
-        media_bytes: bytes,
-        media_mime_type: str,
-        system_prompt: str | None = None,
-        model: str | None = None,
-    ):
-        self.call_count += 1
-        if self.call_count == 1:
-            return {"questions": []}
-        return {"rawText": "1. 원문 추출\n2. 두번째 문제"}
+    def generate_structured_from_media(self, **_kwargs):
+        return next(self._responses)
 
 
 class StubLLMStructuredTimeoutThenRaw:
@@ -108,22 +112,18 @@ class StubLLMStructuredTimeoutThenRaw:
     model_name = "gemini-test"
 
     def __init__(self):
-        self.call_count = 0
+        self._steps = iter(
+            [
+                RuntimeError("The read operation timed out"),
+                {"rawText": "1. 타임아웃 후 원문 추출"},
+            ]
+        )
 
-    def generate_structured_from_media(
-        self,
-        *,
-        prompt: str,
-        schema: dict[str, Any],
-        media_bytes: bytes,
-        media_mime_type: str,
-        system_prompt: str | None = None,
-        model: str | None = None,
-    ):
-        self.call_count += 1
-        if self.call_count == 1:
-            raise RuntimeError("The read operation timed out")
-        return {"rawText": "1. 타임아웃 후 원문 추출"}
+    def generate_structured_from_media(self, **_kwargs):
+        step = next(self._steps)
+        if isinstance(step, Exception):
+            raise step
+        return step
 
 
 class StubLLMAlwaysFails:
@@ -143,42 +143,37 @@ class StubLLMAlwaysFails:
         raise RuntimeError("timeout")
 
 
+_PAGED_RESPONSES = [
+    {
+        "questions": [
+            {
+                "orderIndex": 1,
+                "numberLabel": str(page),
+                "text": f"{page}. page {page} question",
+                "confidence": 0.94,
+                "subject": "science",
+                "unit": "chemistry",
+                "difficulty": "middle",
+                "questionType": "multiple_choice",
+                "answerFormat": "single_choice",
+                "cropTopRatio": 0.1,
+                "cropBottomRatio": 0.9,
+            }
+        ]
+    }
+    for page in (1, 2)
+]
+
+
 class StubLLMPaged:
     provider_name = "gemini"
     model_name = "gemini-test"
 
     def __init__(self):
-        self.call_count = 0
+        self._responses = iter(_PAGED_RESPONSES)
 
-    def generate_structured_from_media(
-        self,
-        *,
-        prompt: str,
-        schema: dict[str, Any],
-        media_bytes: bytes,
-        media_mime_type: str,
-        system_prompt: str | None = None,
-        model: str | None = None,
-    ):
-        self.call_count += 1
-        page = self.call_count
-        return {
-            "questions": [
-                {
-                    "orderIndex": 1,
-                    "numberLabel": str(page),
-                    "text": f"{page}. page {page} question",
-                    "confidence": 0.94,
-                    "subject": "science",
-                    "unit": "chemistry",
-                    "difficulty": "middle",
-                    "questionType": "multiple_choice",
-                    "answerFormat": "single_choice",
-                    "cropTopRatio": 0.1,
-                    "cropBottomRatio": 0.9,
-                }
-            ]
-        }
+    def generate_structured_from_media(self, **_kwargs):
+        return next(self._responses)
 
 
 def test_pipeline_splits_numbered_questions_from_fallback_ocr():
@@ -280,20 +275,7 @@ def test_pdf_fallback_engine_name_reflects_secondary_ocr():
         ocr_fallback=StubVisionOCR(),
         llm_enabled=False,
     )
-    import io
-
-    import fitz  # type: ignore
-    from PIL import Image
-
-    image = Image.new("RGB", (800, 240), "white")
-    image_bytes = io.BytesIO()
-    image.save(image_bytes, format="PNG")
-
-    pdf = fitz.open()
-    page = pdf.new_page(width=900, height=600)
-    page.insert_image(fitz.Rect(20, 20, 880, 560), stream=image_bytes.getvalue())
-    payload = pdf.tobytes()
-    pdf.close()
+    payload = scanned_pdf_bytes((None,))
 
     result = pipeline.extract(
         payload=payload,
@@ -303,143 +285,150 @@ def test_pdf_fallback_engine_name_reflects_secondary_ocr():
     assert result.engine == "google_vision_pdf"
 
 
-def test_pipeline_uses_gemini_full_mode_for_image_without_ocr():
-    import io
-
-    from PIL import Image
-
-    pipeline = DocumentExtractionPipeline(
+def _build_gemini_pipeline(llm, **kwargs) -> DocumentExtractionPipeline:
+    return DocumentExtractionPipeline(
         ocr_fallback=StubOCR(text="fallback", confidence=0.5),
-        llm=StubLLM(),
+        llm=llm,
         llm_enabled=True,
         extraction_mode="gemini_full",
+        **kwargs,
     )
-    image = Image.new("RGB", (400, 200), "white")
-    buf = io.BytesIO()
-    image.save(buf, format="PNG")
+
+
+@pytest.mark.parametrize(
+    ("llm_factory", "expected_engine", "expected_count", "expected_snippet"),
+    [
+        pytest.param(StubLLM, "gemini_vision", 1, "Gemini가 문서를 직접 읽은 문제", id="structured"),
+        pytest.param(StubLLMEmptyStructuredThenRaw, "gemini_vision_text", 2, "원문 추출", id="empty-then-raw"),
+        pytest.param(StubLLMStructuredTimeoutThenRaw, "gemini_vision_text", 1, "타임아웃 후 원문 추출", id="timeout-then-raw"),
+    ],
+)
+def test_pipeline_gemini_full_image_modes(llm_factory, expected_engine, expected_count, expected_snippet):
+    pipeline = _build_gemini_pipeline(llm_factory())
     result = pipeline.extract(
-        payload=buf.getvalue(),
+        payload=png_bytes(400, 200),
         content_type="image/png",
         filename="sample.png",
     )
 
-    assert result.engine == "gemini_vision"
-    assert len(result.questions) == 1
-    assert "Gemini가 문서를 직접 읽은 문제" in result.questions[0].text
-    assert result.questions[0].metadata["cropHint"]["topRatio"] == 0.1
+    assert result.engine == expected_engine
+    assert len(result.questions) == expected_count
+    assert expected_snippet in result.questions[0].text
+    assert result.questions[0].metadata["engine"] == expected_engine
+    if llm_factory is StubLLM:
+        assert result.questions[0].metadata["cropHint"]["topRatio"] == 0.1
 
 
-def test_pipeline_gemini_full_falls_back_to_gemini_raw_text_when_structured_empty():
-    import io
+def test_pipeline_gemini_full_raises_when_all_multimodal_attempts_fail():
+    pipeline = _build_gemini_pipeline(StubLLMAlwaysFails())
 
-    from PIL import Image
+    with pytest.raises(RuntimeError):
+        pipeline.extract(
+            payload=png_bytes(400, 200),
+            content_type="image/png",
+            filename="sample.png",
+        )
+
+
+def test_pipeline_gemini_full_processes_pdf_page_by_page():
+    pipeline = _build_gemini_pipeline(StubLLMPaged())
 
-    pipeline = DocumentExtractionPipeline(
-        ocr_fallback=StubOCR(text="fallback", confidence=0.5),
-        llm=StubLLMEmptyStructuredThenRaw(),
-        llm_enabled=True,
-        extraction_mode="gemini_full",
-    )
-    image = Image.new("RGB", (400, 200), "white")
-    buf = io.BytesIO()
-    image.save(buf, format="PNG")
     result = pipeline.extract(
-        payload=buf.getvalue(),
-        content_type="image/png",
-        filename="sample.png",
+        payload=scanned_pdf_bytes(("p1", "p2")),
+        content_type="application/pdf",
+        filename="sample.pdf",
     )
 
-    assert result.engine == "gemini_vision_text"
+    assert result.engine == "gemini_vision_pages"
     assert len(result.questions) == 2
-    assert result.questions[0].metadata["engine"] == "gemini_vision_text"
-
+    assert result.questions[0].order_index == 1
+    assert result.questions[1].order_index == 2
+    assert result.questions[0].metadata["pageIndex"] == 1
+    assert result.questions[1].metadata["pageIndex"] == 2
 
-def test_pipeline_gemini_full_retries_with_raw_text_when_structured_throws():
-    import io
 
-    from PIL import Image
+class StubLLMPagedBarrier:
+    """Paged stub that only releases once both page calls are in flight."""
 
-    pipeline = DocumentExtractionPipeline(
-        ocr_fallback=StubOCR(text="fallback", confidence=0.5),
-        llm=StubLLMStructuredTimeoutThenRaw(),
-        llm_enabled=True,
-        extraction_mode="gemini_full",
-    )
-    image = Image.new("RGB", (400, 200), "white")
-    buf = io.BytesIO()
-    image.save(buf, format="PNG")
-    result = pipeline.extract(
-        payload=buf.getvalue(),
-        content_type="image/png",
-        filename="sample.png",
-    )
+    provider_name = "gemini"
+    model_name = "gemini-test"
 
-    assert result.engine == "gemini_vision_text"
-    assert len(result.questions) == 1
-    assert result.questions[0].metadata["engine"] == "gemini_vision_text"
+    def __init__(self, parties: int):
+        self.barrier = threading.Barrier(parties)
+        self._responses = iter(_PAGED_RESPONSES)
 
+    def generate_structured_from_media(self, **_kwargs):
+        # Raises BrokenBarrierError (failing the test) if the pipeline
+        # ever dispatches pages serially.
+        self.barrier.wait(timeout=5.0)
+        return next(self._responses)
 
-def test_pipeline_gemini_full_raises_when_all_multimodal_attempts_fail():
-    import io
 
-    from PIL import Image
+def test_pipeline_gemini_full_processes_pdf_pages_concurrently():
+    pipeline = _build_gemini_pipeline(StubLLMPagedBarrier(parties=2), page_concurrency=2)
 
-    pipeline = DocumentExtractionPipeline(
-        ocr_fallback=StubOCR(text="fallback", confidence=0.5),
-        llm=StubLLMAlwaysFails(),
-        llm_enabled=True,
-        extraction_mode="gemini_full",
+    result = pipeline.extract(
+        payload=scanned_pdf_bytes(("p1", "p2")),
+        content_type="application/pdf",
+        filename="sample.pdf",
     )
-    image = Image.new("RGB", (400, 200), "white")
-    buf = io.BytesIO()
-    image.save(buf, format="PNG")
 
-    with pytest.raises(RuntimeError):
-        pipeline.extract(
-            payload=buf.getvalue(),
-            content_type="image/png",
-            filename="sample.png",
-        )
+    assert result.engine == "gemini_vision_pages"
+    assert len(result.questions) == 2
 
 
-def test_pipeline_gemini_full_processes_pdf_page_by_page():
-    import io
+class StubLLMBatched:
+    provider_name = "gemini"
+    model_name = "gemini-test"
 
-    import fitz  # type: ignore
-    from PIL import Image, ImageDraw
+    def __init__(self):
+        self.batch_calls = 0
+        self.single_calls = 0
 
-    pipeline = DocumentExtractionPipeline(
-        ocr_fallback=StubOCR(text="fallback", confidence=0.5),
-        llm=StubLLMPaged(),
-        llm_enabled=True,
-        extraction_mode="gemini_full",
-    )
+    def generate_structured_from_media(self, **_kwargs):
+        self.single_calls += 1
+        raise RuntimeError("per-page path should not be used")
 
-    def _page_image(text: str) -> bytes:
-        image = Image.new("RGB", (900, 600), "white")
-        draw = ImageDraw.Draw(image)
-        draw.text((40, 40), text, fill="black")
-        buf = io.BytesIO()
-        image.save(buf, format="PNG")
-        return buf.getvalue()
-
-    pdf = fitz.open()
-    page1 = pdf.new_page(width=900, height=600)
-    page1.insert_image(fitz.Rect(20, 20, 880, 580), stream=_page_image("p1"))
-    page2 = pdf.new_page(width=900, height=600)
-    page2.insert_image(fitz.Rect(20, 20, 880, 580), stream=_page_image("p2"))
-    payload = pdf.tobytes()
-    pdf.close()
+    def generate_structured_from_media_parts(
+        self,
+        *,
+        prompt: str,
+        schema: dict[str, Any],
+        media_parts: list[tuple[bytes, str]],
+        system_prompt: str | None = None,
+        model: str | None = None,
+    ):
+        self.batch_calls += 1
+        return {
+            "pages": [
+                {
+                    "pageIndex": page,
+                    "questions": [
+                        {
+                            "orderIndex": 1,
+                            "numberLabel": str(page),
+                            "text": f"{page}. batched page {page} question",
+                            "confidence": 0.93,
+                        }
+                    ],
+                }
+                for page in range(1, len(media_parts) + 1)
+            ]
+        }
+
+
+def test_pipeline_gemini_full_batches_pages_into_one_call():
+    llm = StubLLMBatched()
+    pipeline = _build_gemini_pipeline(llm, pages_per_call=2)
 
     result = pipeline.extract(
-        payload=payload,
+        payload=scanned_pdf_bytes((None, None)),
         content_type="application/pdf",
         filename="sample.pdf",
     )
 
-    assert result.engine == "gemini_vision_pages"
+    assert llm.batch_calls == 1
+    assert llm.single_calls == 0
     assert len(result.questions) == 2
-    assert result.questions[0].order_index == 1
-    assert result.questions[1].order_index == 2
     assert result.questions[0].metadata["pageIndex"] == 1
     assert result.questions[1].metadata["pageIndex"] == 2
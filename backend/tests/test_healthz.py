@@ -1,9 +1,4 @@
-from app.main import app
-from tests.http_client import SyncASGIClient
-
-
-def test_healthz_200():
-    client = SyncASGIClient(app)
+def test_healthz_200(client):
     resp = client.get("/healthz")
 
     assert resp.status_code == 200
@@ -1,15 +1,10 @@
 import json
 from pathlib import Path
 
-from app.main import app
+_SNAPSHOT_PATH = Path(__file__).parent / "snapshots" / "openapi_required_paths.json"
+_REQUIRED_PATHS = frozenset(json.loads(_SNAPSHOT_PATH.read_text(encoding="utf-8"))["requiredPaths"])
 
 
-def test_openapi_contains_required_paths_snapshot():
-    snapshot_path = Path(__file__).parent / "snapshots" / "openapi_required_paths.json"
-    expected = json.loads(snapshot_path.read_text(encoding="utf-8"))
-
-    schema = app.openapi()
-    actual_paths = set(schema.get("paths", {}).keys())
-
-    for required_path in expected["requiredPaths"]:
-        assert required_path in actual_paths
+def test_openapi_contains_required_paths_snapshot(openapi_schema):
+    missing = _REQUIRED_PATHS - openapi_schema.get("paths", {}).keys()
+    assert not missing, f"OpenAPI schema lost required paths: {sorted(missing)}"
@@ -1,41 +1,33 @@
 from __future__ import annotations
 
-import io
-import time
-
-from PIL import Image, ImageDraw
-
 from app.core.config import get_settings
-from app.main import app
 from app.workers.extraction.cropper import QuestionCropper
 from app.workers.extraction.pipeline import DocumentExtractionPipeline
 from tests.http_client import SyncASGIClient
+from tests.sample_media import png_bytes
 
 
 def _make_sample_image() -> bytes:
-    image = Image.new("RGB", (1200, 900), "white")
-    draw = ImageDraw.Draw(image)
-    draw.text((40, 80), "1. first question", fill="black")
-    draw.text((40, 220), "1) A 2) B 3) C", fill="black")
-    draw.text((40, 480), "2. second question", fill="black")
-    buf = io.BytesIO()
-    image.save(buf, format="PNG")
-    return buf.getvalue()
+    return png_bytes(
+        1200,
+        900,
+        (
+            (40, 80, "1. first question"),
+            (40, 220, "1) A 2) B 3) C"),
+            (40, 480, "2. second question"),
+        ),
+    )
 
 
-def _wait_questions(client: SyncASGIClient, set_id: str, timeout_seconds: float = 3.0):
-    deadline = time.time() + timeout_seconds
-    while time.time() < deadline:
-        resp = client.get(f"/v2/sets/{set_id}/questions")
-        assert resp.status_code == 200
-        items = resp.json()["questions"]
-        if items:
-            return items
-        time.sleep(0.05)
-    return []
+def _get_questions(client: SyncASGIClient, set_id: str) -> list[dict]:
+    # conftest forces SEDU_SYNC_PROCESSING=1, so extraction finished
+    # before the upload POST returned; no polling loop needed.
+    resp = client.get(f"/v2/sets/{set_id}/questions")
+    assert resp.status_code == 200
+    return resp.json()["questions"]
 
 
-def test_question_crop_url_contract(monkeypatch):
+def test_question_crop_url_contract(client, monkeypatch):
     monkeypatch.setattr(
         DocumentExtractionPipeline,
         "_extract_image",
@@ -47,7 +39,6 @@ def test_question_crop_url_contract(monkeypatch):
         lambda self, image: [],
     )
 
-    client = SyncASGIClient(app)
     payload = _make_sample_image()
 
     created = client.post(
@@ -57,7 +48,7 @@ def test_question_crop_url_contract(monkeypatch):
     assert created.status_code == 200
     set_id = created.json()["setId"]
 
-    questions = _wait_questions(client, set_id)
+    questions = _get_questions(client, set_id)
     assert questions
     first = questions[0]
     assert first.get("croppedImageUrl")
@@ -73,4 +64,4 @@ def test_question_crop_url_contract(monkeypatch):
     relative_key = cropped_url.removeprefix("/uploads/")
     crop_path = get_settings().upload_dir / relative_key
     assert crop_path.exists()
-    assert crop_path.read_bytes().startswith(b"\x89PNG")
+    assert crop_path.read_bytes().startswith(b"\xff\xd8\xff")
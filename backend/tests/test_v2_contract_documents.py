@@ -1,38 +1,32 @@
-import time
-
-from app.main import app
 from tests.http_client import SyncASGIClient
 
+_DOC_CREATE_KEYS = frozenset({"documentId", "setId", "jobId", "status"})
 
-def _wait_for_job_terminal(client: SyncASGIClient, job_id: str, timeout_seconds: float = 2.0) -> dict:
-    deadline = time.time() + timeout_seconds
-    latest: dict = {}
-    while time.time() < deadline:
-        resp = client.get(f"/v2/jobs/{job_id}")
-        assert resp.status_code == 200
-        latest = resp.json()
-        if latest["status"] in {"done", "failed"}:
-            return latest
-        time.sleep(0.05)
-    return latest
 
+def _get_job(client: SyncASGIClient, job_id: str, *, expected_status: str) -> dict:
+    # Processing ran synchronously inside the POST (SEDU_SYNC_PROCESSING=1),
+    # so the job is already terminal on first read. Failing here instead of
+    # at the caller keeps the whole job body in the failure message.
+    resp = client.get(f"/v2/jobs/{job_id}")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == expected_status, f"unexpected job state: {body}"
+    return body
 
-def test_create_document_contract_and_job_lookup():
-    client = SyncASGIClient(app)
 
+def test_create_document_contract_and_job_lookup(client):
     files = {"file": ("sample.pdf", b"%PDF-1.4 mock", "application/pdf")}
     resp = client.post("/v2/documents", files=files)
     assert resp.status_code == 200
 
     body = resp.json()
-    assert set(body.keys()) == {"documentId", "setId", "jobId", "status"}
+    assert body.keys() == _DOC_CREATE_KEYS
     assert body["setId"].startswith("set_")
     assert body["jobId"].startswith("job_")
 
-    job_body = _wait_for_job_terminal(client, body["jobId"])
+    job_body = _get_job(client, body["jobId"], expected_status="done")
     assert job_body["jobId"] == body["jobId"]
     assert job_body["setId"] == body["setId"]
-    assert job_body["status"] == "done"
     assert job_body["percent"] == 100.0
 
     sets_resp = client.get("/v2/sets?limit=10&offset=0")
@@ -1,6 +1,3 @@
-import time
-
-from app.main import app
 from tests.http_client import SyncASGIClient
 
 
@@ -9,20 +6,15 @@ def _create_set_and_question(client: SyncASGIClient) -> tuple[str, str]:
     created = client.post("/v2/documents", files=files).json()
     set_id = created["setId"]
 
-    deadline = time.time() + 2.0
-    while time.time() < deadline:
-        q_resp = client.get(f"/v2/sets/{set_id}/questions")
-        assert q_resp.status_code == 200
-        questions = q_resp.json()["questions"]
-        if questions:
-            return set_id, questions[0]["questionId"]
-        time.sleep(0.05)
-
-    raise AssertionError("Timed out waiting for extracted questions")
+    # Sync processing in tests: questions exist as soon as the POST returns.
+    q_resp = client.get(f"/v2/sets/{set_id}/questions")
+    assert q_resp.status_code == 200
+    questions = q_resp.json()["questions"]
+    assert questions, "expected extracted questions right after synchronous upload"
+    return set_id, questions[0]["questionId"]
 
 
-def test_review_queue_and_patch_contract():
-    client = SyncASGIClient(app)
+def test_review_queue_and_patch_contract(client):
     _, question_id = _create_set_and_question(client)
 
     reprocess = client.post(f"/v2/questions/{question_id}/reprocess")
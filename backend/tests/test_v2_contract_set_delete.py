@@ -1,4 +1,3 @@
-from app.main import app
 from tests.http_client import SyncASGIClient
 
 
@@ -9,8 +8,7 @@ def _create_set(client: SyncASGIClient) -> tuple[str, str]:
     return body["setId"], body["jobId"]
 
 
-def test_delete_set_contract():
-    client = SyncASGIClient(app)
+def test_delete_set_contract(client):
     set_id, job_id = _create_set(client)
 
     deleted = client.delete(f"/v2/sets/{set_id}")
@@ -29,7 +27,6 @@ def test_delete_set_contract():
     assert job_resp.status_code == 404
 
 
-def test_delete_set_404_contract():
-    client = SyncASGIClient(app)
+def test_delete_set_404_contract(client):
     resp = client.delete("/v2/sets/set_not_exists")
     assert resp.status_code == 404
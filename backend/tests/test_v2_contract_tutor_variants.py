@@ -1,6 +1,3 @@
-import time
-
-from app.main import app
 from tests.http_client import SyncASGIClient
 
 
@@ -9,19 +6,16 @@ def _create_question(client: SyncASGIClient) -> str:
     assert created.status_code == 200
     set_id = created.json()["setId"]
 
-    deadline = time.time() + 2.0
-    while time.time() < deadline:
-        resp = client.get(f"/v2/sets/{set_id}/questions")
-        assert resp.status_code == 200
-        items = resp.json()["questions"]
-        if items:
-            return items[0]["questionId"]
-        time.sleep(0.05)
-    raise AssertionError("Timed out waiting for question extraction")
+    # Upload processing is synchronous under the test env, so one read
+    # suffices instead of the old 50 ms polling loop.
+    resp = client.get(f"/v2/sets/{set_id}/questions")
+    assert resp.status_code == 200
+    items = resp.json()["questions"]
+    assert items, "question extraction should have completed during the upload"
+    return items[0]["questionId"]
 
 
-def test_hint_and_variant_contract():
-    client = SyncASGIClient(app)
+def test_hint_and_variant_contract(client):
     question_id = _create_question(client)
 
     hint = client.post(
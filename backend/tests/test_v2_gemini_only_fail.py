@@ -1,39 +1,31 @@
-import time
-
 from app.api.v2 import dependencies
 from app.core.config import get_settings
-from app.main import app
 from tests.http_client import SyncASGIClient
 
 
 def _clear_caches() -> None:
+    # Only settings and the LLM adapter derive from the env vars this
+    # test patches; store, storage and OCR caches can stay warm.
     get_settings.cache_clear()
-    dependencies.get_store.cache_clear()
-    dependencies.get_storage.cache_clear()
-    dependencies.get_ocr.cache_clear()
     dependencies.get_llm.cache_clear()
 
 
-def _wait_terminal(client: SyncASGIClient, job_id: str, timeout_seconds: float = 3.0) -> dict:
-    deadline = time.time() + timeout_seconds
-    latest = {}
-    while time.time() < deadline:
-        resp = client.get(f"/v2/jobs/{job_id}")
-        assert resp.status_code == 200
-        latest = resp.json()
-        if latest.get("status") in {"done", "failed"}:
-            return latest
-        time.sleep(0.05)
-    return latest
+def _get_job(client: SyncASGIClient, job_id: str, *, expected_status: str) -> dict:
+    # The document POST processes inline in tests; the job has already
+    # reached its terminal state when we read it.
+    resp = client.get(f"/v2/jobs/{job_id}")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["status"] == expected_status, f"unexpected job state: {body}"
+    return body
 
 
-def test_gemini_full_mode_fails_job_instead_of_ocr_fallback(monkeypatch):
+def test_gemini_full_mode_fails_job_instead_of_ocr_fallback(client, monkeypatch):
     monkeypatch.setenv("SEDU_EXTRACTION_MODE", "gemini_full")
     monkeypatch.setenv("SEDU_LLM_BACKEND", "mock")
     _clear_caches()
 
     try:
-        client = SyncASGIClient(app)
         created = client.post(
             "/v2/documents",
             files={"file": ("sample.pdf", b"%PDF-1.4 mock", "application/pdf")},
@@ -41,8 +33,7 @@ def test_gemini_full_mode_fails_job_instead_of_ocr_fallback(monkeypatch):
         assert created.status_code == 200
         body = created.json()
 
-        job = _wait_terminal(client, body["jobId"])
-        assert job["status"] == "failed"
+        job = _get_job(client, body["jobId"], expected_status="failed")
         assert job["stage"] == "error"
         assert "gemini_full mode requires a multimodal LLM backend" in (job.get("errorMessage") or "")
 
@@ -1,6 +1,6 @@
 """Routes for extraction jobs."""
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -8,6 +8,7 @@ from app.pipeline.orchestrator import can_run_real_pipeline, run_real_extraction
 from app.repo.jobs import ActiveExtractionJobExistsError, create_job, get_job_by_public_id
 from app.repo.sets import get_set_by_public_id
 from app.schemas.job import ExtractionJobCreatedResponse, ExtractionJobDetailResponse
+from app.services.extraction_pool import submit_extraction
 from app.services.extraction_simulator import run_fake_extraction
 
 router = APIRouter(tags=["extraction-jobs"])
@@ -17,7 +18,6 @@ router = APIRouter(tags=["extraction-jobs"])
              response_model=ExtractionJobCreatedResponse)
 async def create_extraction_job(
     set_public_id: str,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Create an extraction job row and start extraction pipeline."""
@@ -37,9 +37,9 @@ async def create_extraction_job(
         ) from exc
 
     if can_run_real_pipeline():
-        background_tasks.add_task(run_real_extraction, job.public_id)
+        submit_extraction(run_real_extraction, job.public_id)
     else:
-        background_tasks.add_task(run_fake_extraction, job.public_id)
+        submit_extraction(run_fake_extraction, job.public_id)
 
     return ExtractionJobCreatedResponse(
         jobId=job.public_id,
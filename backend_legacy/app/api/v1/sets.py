@@ -2,7 +2,7 @@
 
 from urllib.parse import quote
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, UploadFile
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
@@ -16,6 +16,7 @@ from app.repo.questions import list_questions_for_set
 from app.repo.sets import create_set, get_set_by_public_id, list_sets
 from app.schemas.question import QuestionListResponse, QuestionSummary
 from app.schemas.set import SetCreatedResponse, SetDetailResponse, SetListResponse, SetSummaryResponse
+from app.services.extraction_pool import submit_extraction
 from app.services.extraction_simulator import run_fake_extraction
 
 router = APIRouter(prefix="/v1/sets", tags=["sets"])
@@ -51,7 +52,6 @@ async def list_sets_route(
 @router.post("", response_model=SetCreatedResponse)
 async def create_set_route(
     file: UploadFile,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
     """Upload a file, create a set, and auto-start extraction."""
@@ -79,9 +79,9 @@ async def create_set_route(
 
     # Pick pipeline: real (Vision OCR) or fake (simulator).
     if can_run_real_pipeline():
-        background_tasks.add_task(run_real_extraction, job.public_id)
+        submit_extraction(run_real_extraction, job.public_id)
     else:
-        background_tasks.add_task(run_fake_extraction, job.public_id)
+        submit_extraction(run_fake_extraction, job.public_id)
 
     return SetCreatedResponse(setId=set_obj.public_id, status=set_obj.status)
 
@@ -1,7 +1,12 @@
 """SQLAlchemy declarative base."""
 
+from sqlalchemy import JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import DeclarativeBase
 
+# JSONB on Postgres (matches migrations/schema.sql); plain JSON on SQLite dev DBs.
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class Base(DeclarativeBase):
     """Base class for all ORM models."""
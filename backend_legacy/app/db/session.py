@@ -8,7 +8,8 @@ from collections.abc import Generator
 from functools import lru_cache
 from pathlib import Path
 
-from sqlalchemy import Engine, create_engine, event
+import orjson
+from sqlalchemy import Engine, create_engine, event, text
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.env import load_backend_env
@@ -40,12 +41,23 @@ def _get_database_url() -> str:
 @lru_cache(maxsize=1)
 def _get_engine() -> Engine:
     url = _get_database_url()
-    kwargs: dict = {}
+    kwargs: dict = {
+        "json_serializer": lambda obj: orjson.dumps(obj).decode(),
+        "json_deserializer": orjson.loads,
+    }
 
     if url.startswith("sqlite"):
         kwargs["connect_args"] = {"check_same_thread": False}
     else:
-        kwargs["pool_pre_ping"] = True
+        # No per-checkout SELECT 1: staleness is handled by pool_recycle plus
+        # the periodic keepalive ping started from the app lifespan.
+        kwargs.update(
+            pool_size=20,
+            max_overflow=40,
+            pool_pre_ping=False,
+            pool_recycle=1800,
+            pool_use_lifo=True,
+        )
 
     engine = create_engine(url, **kwargs)
 
@@ -60,6 +72,7 @@ def _get_engine() -> Engine:
     return engine
 
 
+@lru_cache(maxsize=1)
 def _get_session_factory() -> sessionmaker[Session]:
     return sessionmaker(
         autocommit=False,
@@ -69,6 +82,12 @@ def _get_session_factory() -> sessionmaker[Session]:
     )
 
 
+def ping_database() -> None:
+    """Issue a trivial query to keep pooled connections warm."""
+    with _get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
 def get_db() -> Generator[Session, None, None]:
     db = _get_session_factory()()
     try:
@@ -1,4 +1,6 @@
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,18 +11,41 @@ from app.api.v1 import extraction_jobs, questions, sets
 from app import models as _models  # noqa: F401
 from app.core.env import load_backend_env
 from app.db.base import Base
-from app.db.session import _get_engine
+from app.db.session import _get_engine, ping_database
 from app.pipeline.orchestrator import uploads_dir
+from app.services.extraction_pool import shutdown_extraction_pool, start_extraction_pool
+
+logger = logging.getLogger(__name__)
 
 # Load backend/.env early (if present).
 load_backend_env()
 
+_KEEPALIVE_INTERVAL_SECONDS = 300
+
+
+async def _pool_keepalive() -> None:
+    """Ping the DB periodically so pooled connections stay usable without pre_ping."""
+    while True:
+        await asyncio.sleep(_KEEPALIVE_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(ping_database)
+        except Exception:
+            logger.warning("DB keepalive ping failed", exc_info=True)
+
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
     # Auto-create tables (safe no-op if they already exist).
     Base.metadata.create_all(bind=_get_engine())
-    yield
+    start_extraction_pool()
+    keepalive = asyncio.create_task(_pool_keepalive())
+    try:
+        yield
+    finally:
+        keepalive.cancel()
+        with suppress(asyncio.CancelledError):
+            await keepalive
+        shutdown_extraction_pool()
 
 
 app = FastAPI(title="SEDU API", version="0.1.0", lifespan=lifespan)
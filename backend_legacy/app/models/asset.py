@@ -6,10 +6,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, DateTime, ForeignKey, Text, Uuid, func
+from sqlalchemy import DateTime, ForeignKey, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, JSONVariant
 
 if TYPE_CHECKING:
     from app.models.question import Question
@@ -33,7 +33,7 @@ class Asset(Base):
 
     type: Mapped[str] = mapped_column(Text, nullable=False)
     asset_key: Mapped[str] = mapped_column(Text, nullable=False)
-    bbox: Mapped[dict[str, Any] | None] = mapped_column(JSON)
+    bbox: Mapped[dict[str, Any] | None] = mapped_column(JSONVariant)
 
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
@@ -6,10 +6,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Text, Uuid, func
+from sqlalchemy import DateTime, Float, ForeignKey, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, JSONVariant
 
 if TYPE_CHECKING:
     from app.models.set import Set
@@ -36,7 +36,7 @@ class ExtractionJob(Base):
     progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
 
     options: Mapped[dict[str, Any]] = mapped_column(
-        JSON,
+        JSONVariant,
         nullable=False,
         default=dict,
     )
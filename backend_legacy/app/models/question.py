@@ -6,10 +6,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import JSON, DateTime, Float, ForeignKey, Integer, Text, Uuid, func
+from sqlalchemy import DateTime, Float, ForeignKey, Integer, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, JSONVariant
 
 if TYPE_CHECKING:
     from app.models.asset import Asset
@@ -41,13 +41,13 @@ class Question(Base):
     ocr_text: Mapped[str | None] = mapped_column(Text)
 
     structure: Mapped[dict[str, Any]] = mapped_column(
-        JSON,
+        JSONVariant,
         nullable=False,
         default=dict,
     )
     metadata_json: Mapped[dict[str, Any]] = mapped_column(
         "metadata",
-        JSON,
+        JSONVariant,
         nullable=False,
         default=dict,
     )
@@ -48,7 +48,10 @@ def normalize_response(response: Any) -> dict:
             "avg_confidence": None,
         }
 
-    all_confidences: list[float] = []
+    # Running sums instead of materializing every confidence; for large
+    # multi-page responses this keeps normalization at O(1) extra memory.
+    conf_sum = 0.0
+    conf_count = 0
     pages_out: list[dict] = []
 
     for page in annotation.pages:
@@ -62,7 +65,8 @@ def normalize_response(response: Any) -> dict:
                     conf: float | None = None
                     if hasattr(word, "confidence") and word.confidence:
                         conf = round(word.confidence, 4)
-                        all_confidences.append(word.confidence)
+                        conf_sum += word.confidence
+                        conf_count += 1
 
                     bbox = _vertices_to_bbox(word.bounding_box.vertices)
                     words_out.append({
@@ -75,8 +79,8 @@ def normalize_response(response: Any) -> dict:
         pages_out.append({"blocks": blocks_out})
 
     avg_conf: float | None = None
-    if all_confidences:
-        avg_conf = round(sum(all_confidences) / len(all_confidences), 4)
+    if conf_count:
+        avg_conf = round(conf_sum / conf_count, 4)
 
     return {
         "full_text": annotation.text or "",
@@ -8,6 +8,7 @@ from sqlalchemy.orm import Session
 
 from app.models.question import Question
 from app.ocr.vision_client import VisionOCRClient
+from app.pipeline.ocr_tokens import encode_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -15,22 +16,18 @@ _AUTO_OK_THRESHOLD = 0.85
 
 
 def _flatten_tokens(pages: list[dict]) -> list[dict]:
-    """Flatten pages/blocks/paragraphs/words into a simple token list.
-
-    Returns:
-        [{"text": "...", "bbox": {x1,y1,x2,y2}, "conf": 0.93}, ...]
-    """
-    tokens: list[dict] = []
-    for page in pages:
-        for block in page.get("blocks", []):
-            for para in block.get("paragraphs", []):
-                for word in para.get("words", []):
-                    tokens.append({
-                        "text": word["text"],
-                        "bbox": word["bbox"],
-                        "conf": word["confidence"],
-                    })
-    return tokens
+    """Flatten pages/blocks/paragraphs/words into flat token dicts."""
+    return [
+        {
+            "text": word["text"],
+            "bbox": word["bbox"],
+            "conf": word["confidence"],
+        }
+        for page in pages
+        for block in page.get("blocks", [])
+        for para in block.get("paragraphs", [])
+        for word in para.get("words", [])
+    ]
 
 
 def run_ocr_for_question(
@@ -46,7 +43,7 @@ def run_ocr_for_question(
     Updates:
         - question.ocr_text          = full_text
         - question.confidence         = avg_confidence
-        - question.structure          += {"ocr_tokens": [...]}
+        - question.structure          += {"ocr_tokens_npy": ..., "ocr_token_count": N}
         - question.metadata           += {"ocr_avg_confidence": ...}
         - question.review_status      = auto_ok | auto_flagged
     If ``commit`` is False, caller is responsible for transaction commit.
@@ -62,15 +59,17 @@ def run_ocr_for_question(
     question.confidence = avg_conf
 
     # Merge into structure (preserve existing keys).
-    structure = dict(question.structure) if question.structure else {}
-    structure["ocr_tokens"] = _flatten_tokens(result["pages"])
-    question.structure = structure
+    question.structure = {
+        **(question.structure or {}),
+        **encode_tokens(_flatten_tokens(result["pages"])),
+    }
 
     # Merge into metadata.
-    meta = dict(question.metadata_json) if question.metadata_json else {}
-    meta["ocr_avg_confidence"] = avg_conf
-    meta["ocr_source"] = "crop_vision"
-    question.metadata_json = meta
+    question.metadata_json = {
+        **(question.metadata_json or {}),
+        "ocr_avg_confidence": avg_conf,
+        "ocr_source": "crop_vision",
+    }
 
     # Review status based on confidence.
     if avg_conf is not None and avg_conf >= _AUTO_OK_THRESHOLD:
@@ -0,0 +1,96 @@
+"""Compact NumPy representation for persisted OCR tokens.
+
+A page of OCR output can hold thousands of tokens; storing them as
+``list[dict]`` costs hundreds of bytes per token in dict/object headers.
+The numeric part of each token (int16 bbox, float32 confidence, text
+length) is packed into a structured array and persisted base64-encoded
+inside ``question.structure``; token texts are concatenated into one
+plain string so they stay variable-length instead of padding every row
+to a fixed-width Unicode column. Readers should go through
+:func:`decode_structure_tokens`, which also understands the legacy
+``ocr_tokens`` list-of-dicts format.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+import numpy as np
+
+TOKEN_DTYPE = np.dtype(
+    [
+        ("x1", "i2"),
+        ("y1", "i2"),
+        ("x2", "i2"),
+        ("y2", "i2"),
+        ("conf", "f4"),
+        ("tlen", "u2"),
+    ]
+)
+
+_NPY_KEY = "ocr_tokens_npy"
+_TEXT_KEY = "ocr_tokens_text"
+_COUNT_KEY = "ocr_token_count"
+
+
+def encode_tokens(tokens: list[dict]) -> dict[str, Any]:
+    """Return the structure keys that persist ``[{"text", "bbox", "conf"}, ...]``."""
+    arr = np.empty(len(tokens), dtype=TOKEN_DTYPE)
+    texts: list[str] = []
+    for i, token in enumerate(tokens):
+        bbox = token.get("bbox") or {}
+        text = str(token.get("text") or "")
+        conf = token.get("conf", token.get("confidence"))
+        texts.append(text)
+        arr[i] = (
+            int(bbox.get("x1", 0)),
+            int(bbox.get("y1", 0)),
+            int(bbox.get("x2", 0)),
+            int(bbox.get("y2", 0)),
+            np.nan if conf is None else float(conf),
+            len(text),
+        )
+    return {
+        _NPY_KEY: base64.b64encode(arr.tobytes()).decode(),
+        _TEXT_KEY: "".join(texts),
+        _COUNT_KEY: len(tokens),
+    }
+
+
+def _decode_packed(encoded: str, text_blob: str) -> list[dict]:
+    arr = np.frombuffer(base64.b64decode(encoded), dtype=TOKEN_DTYPE)
+    tokens: list[dict] = []
+    pos = 0
+    for row in arr:
+        end = pos + int(row["tlen"])
+        conf = float(row["conf"])
+        tokens.append(
+            {
+                "text": text_blob[pos:end],
+                "bbox": {
+                    "x1": int(row["x1"]),
+                    "y1": int(row["y1"]),
+                    "x2": int(row["x2"]),
+                    "y2": int(row["y2"]),
+                },
+                # float32 carries decimal noise (0.9 → 0.90000004…);
+                # round past any confidence precision OCR actually emits.
+                "conf": None if np.isnan(conf) else round(conf, 6),
+            }
+        )
+        pos = end
+    return tokens
+
+
+def decode_structure_tokens(structure: dict | None) -> list[dict]:
+    """Read tokens out of ``question.structure`` in either storage format."""
+    if not isinstance(structure, dict):
+        return []
+
+    encoded = structure.get(_NPY_KEY)
+    if isinstance(encoded, str):
+        return _decode_packed(encoded, str(structure.get(_TEXT_KEY) or ""))
+
+    tokens = structure.get("ocr_tokens")
+    return tokens if isinstance(tokens, list) else []
@@ -21,6 +21,7 @@ from app.db.session import _get_session_factory
 from app.models.extraction_job import ExtractionJob
 from app.models.question import Question
 from app.models.set import Set
+from app.pipeline.ocr_tokens import encode_tokens
 from app.utils.ids import new_public_id
 
 logger = logging.getLogger(__name__)
@@ -46,14 +47,15 @@ def _update_job(db: Session, job: ExtractionJob, stage: str, progress: float) ->
 
 
 def _load_job_and_set(db: Session, job_public_id: str) -> tuple[ExtractionJob, Set] | None:
-    stmt = select(ExtractionJob).where(ExtractionJob.public_id == job_public_id)
-    job = db.execute(stmt).scalar_one_or_none()
-    if job is None:
+    stmt = (
+        select(ExtractionJob, Set)
+        .join(Set, ExtractionJob.set_id == Set.id)
+        .where(ExtractionJob.public_id == job_public_id)
+    )
+    row = db.execute(stmt).one_or_none()
+    if row is None:
         return None
-    set_obj = db.get(Set, job.set_id)
-    if set_obj is None:
-        return None
-    return job, set_obj
+    return row[0], row[1]
 
 
 def _truncate_message(message: str, limit: int) -> str:
@@ -180,9 +182,10 @@ def _apply_page_ocr_to_question(question: Question, page_tokens: list[dict], bbo
     question.ocr_text = q_text
     question.confidence = avg_conf
 
-    structure = dict(question.structure) if question.structure else {}
-    structure["ocr_tokens"] = q_tokens
-    question.structure = structure
+    question.structure = {
+        **(question.structure or {}),
+        **encode_tokens(q_tokens),
+    }
 
     metadata = dict(question.metadata_json) if question.metadata_json else {}
     metadata["ocr_avg_confidence"] = avg_conf
@@ -18,6 +18,7 @@ from app.gemini.validate import (
     validate_question_structure,
     validate_segmentation_qc,
 )
+from app.pipeline.ocr_tokens import decode_structure_tokens
 
 _SCHEMA_PATH = (
     Path(__file__).resolve().parent.parent / "gemini" / "schemas" / "question_structure.v1.json"
@@ -63,9 +64,7 @@ def _get_source_page(question_row) -> int:
 def build_structure_input(question_row) -> dict[str, str]:
     """Build placeholder values used by Gemini prompt templates."""
     structure = getattr(question_row, "structure", None) or {}
-    tokens = structure.get("ocr_tokens") if isinstance(structure, dict) else None
-    if not isinstance(tokens, list):
-        tokens = []
+    tokens = decode_structure_tokens(structure if isinstance(structure, dict) else None)
 
     set_public_id = ""
     if getattr(question_row, "set", None) is not None:
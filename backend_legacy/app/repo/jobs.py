@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select
 from sqlalchemy.orm import Session
 
 from app.models.extraction_job import ExtractionJob
@@ -61,5 +61,5 @@ def create_job(
 
 
 def get_job_by_public_id(db: Session, public_id: str) -> ExtractionJob | None:
-    stmt = select(ExtractionJob).where(ExtractionJob.public_id == public_id)
+    stmt = lambda_stmt(lambda: select(ExtractionJob).where(ExtractionJob.public_id == public_id))
     return db.execute(stmt).scalar_one_or_none()
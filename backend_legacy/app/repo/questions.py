@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from sqlalchemy import select
+from sqlalchemy import lambda_stmt, select, update
 from sqlalchemy.orm import Session
 
 from app.models.question import Question
@@ -10,16 +10,17 @@ from app.models.set import Set
 
 
 def list_questions_for_set(db: Session, set_obj: Set) -> list[Question]:
-    stmt = (
-        select(Question)
-        .where(Question.set_id == set_obj.id)
+    set_id = set_obj.id
+    stmt = lambda_stmt(
+        lambda: select(Question)
+        .where(Question.set_id == set_id)
         .order_by(Question.order_index.asc())
     )
     return list(db.execute(stmt).scalars().all())
 
 
 def get_question_by_public_id(db: Session, public_id: str) -> Question | None:
-    stmt = select(Question).where(Question.public_id == public_id)
+    stmt = lambda_stmt(lambda: select(Question).where(Question.public_id == public_id))
     return db.execute(stmt).scalar_one_or_none()
 
 
@@ -32,21 +33,23 @@ def patch_question_by_public_id(
     metadata: dict | None = None,
     review_status: str | None = None,
 ) -> Question | None:
-    question = get_question_by_public_id(db, public_id)
-    if question is None:
-        return None
-
-    if ocr_text is not None:
-        question.ocr_text = ocr_text
-    if structure is not None:
-        question.structure = structure
-    if metadata is not None:
-        question.metadata_json = metadata
-    if review_status is not None:
-        question.review_status = review_status
-
-    db.add(question)
+    values = {
+        key: value
+        for key, value in (
+            ("ocr_text", ocr_text),
+            ("structure", structure),
+            ("metadata_json", metadata),
+            ("review_status", review_status),
+        )
+        if value is not None
+    }
+    if not values:
+        return get_question_by_public_id(db, public_id)
+
+    # Single UPDATE .. RETURNING instead of SELECT + mutate + refresh.
+    question = db.execute(
+        update(Question).where(Question.public_id == public_id).values(**values).returning(Question)
+    ).scalar_one_or_none()
     db.commit()
-    db.refresh(question)
     return question
 
@@ -0,0 +1,95 @@
+"""Dedicated worker pool for extraction jobs.
+
+Extraction runs for seconds (longer with real OCR + Gemini), so pushing
+it through FastAPI ``BackgroundTasks`` would occupy the shared Starlette
+threadpool and starve blocking dependencies under load. Jobs are instead
+submitted to a process pool sized to the machine, with the job public id
+as the only payload — the task reopens its own DB session.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+_pool: ProcessPoolExecutor | None = None
+
+
+def _worker_init() -> None:
+    """Drop DB state inherited across fork.
+
+    The lifespan creates tables before starting the pool, so forked
+    workers inherit the lru_cached engine along with its checked-in
+    connections. Sharing those sockets with the parent corrupts the wire
+    protocol; dispose the inherited pool (without closing the parent's
+    fds) so each worker opens fresh connections on first use.
+    """
+    from app.db.session import _get_engine
+
+    _get_engine().dispose(close=False)
+
+
+def start_extraction_pool() -> None:
+    """Create the process pool; called from the app lifespan."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_worker_init)
+
+
+def shutdown_extraction_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def _mark_job_failed(job_public_id: str, message: str) -> None:
+    from app.db.session import _get_session_factory
+    from app.models.extraction_job import ExtractionJob
+
+    db = _get_session_factory()()
+    try:
+        job = (
+            db.query(ExtractionJob)
+            .filter(ExtractionJob.public_id == job_public_id)
+            .one_or_none()
+        )
+        if job is not None and job.status not in ("done", "failed"):
+            job.status = "failed"
+            job.error_message = message[:500]
+            db.commit()
+    except Exception:
+        logger.exception("Failed to mark job %s as failed", job_public_id)
+    finally:
+        db.close()
+
+
+def _log_task_result(job_public_id: str, future: Future) -> None:
+    """Surface worker-side failures the task itself could not record.
+
+    The task marks its own job failed for in-task exceptions, but errors
+    raised before it runs (pickling, BrokenProcessPool after a worker
+    crash) would otherwise vanish with the dropped Future.
+    """
+    exc = future.exception()
+    if exc is not None:
+        logger.error("Extraction task for job %s failed in worker: %s", job_public_id, exc)
+        _mark_job_failed(job_public_id, f"extraction worker failed: {exc}")
+
+
+def submit_extraction(task: Callable[[str], None], job_public_id: str) -> None:
+    """Run an extraction task off the request path.
+
+    Uses the dedicated process pool when started; falls back to a daemon
+    thread when the lifespan has not run (tests, scripts).
+    """
+    if _pool is not None:
+        future = _pool.submit(task, job_public_id)
+        future.add_done_callback(lambda fut: _log_task_result(job_public_id, fut))
+        return
+    threading.Thread(target=task, args=(job_public_id,), daemon=True).start()
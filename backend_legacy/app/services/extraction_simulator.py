@@ -20,7 +20,7 @@ from app.db.session import _get_session_factory
 from app.models.extraction_job import ExtractionJob
 from app.models.question import Question
 from app.models.set import Set
-from app.utils.ids import new_public_id
+from app.utils.ids import new_public_ids
 
 logger = logging.getLogger(__name__)
 
@@ -36,14 +36,15 @@ QUESTION_COUNT = 5
 
 
 def _load_job_and_set(db: Session, job_public_id: str) -> tuple[ExtractionJob, Set] | None:
-    stmt = select(ExtractionJob).where(ExtractionJob.public_id == job_public_id)
-    job = db.execute(stmt).scalar_one_or_none()
-    if job is None:
+    stmt = (
+        select(ExtractionJob, Set)
+        .join(Set, ExtractionJob.set_id == Set.id)
+        .where(ExtractionJob.public_id == job_public_id)
+    )
+    row = db.execute(stmt).one_or_none()
+    if row is None:
         return None
-    set_obj = db.get(Set, job.set_id)
-    if set_obj is None:
-        return None
-    return job, set_obj
+    return row[0], row[1]
 
 
 def _run_ocr_if_available(db: Session, question: Question) -> None:
@@ -88,9 +89,10 @@ def run_fake_extraction(job_public_id: str) -> None:
 
         # Generate placeholder questions
         time.sleep(0.5)
-        for i in range(1, QUESTION_COUNT + 1):
-            q = Question(
-                public_id=new_public_id("q_"),
+        question_ids = new_public_ids("q_", QUESTION_COUNT)
+        questions = [
+            Question(
+                public_id=question_ids[i - 1],
                 set_id=set_obj.id,
                 order_index=i,
                 number_label=str(i),
@@ -106,9 +108,13 @@ def run_fake_extraction(job_public_id: str) -> None:
                 confidence=0.85,
                 review_status="auto_ok",
             )
-            db.add(q)
-            db.flush()
+            for i in range(1, QUESTION_COUNT + 1)
+        ]
+        # One flush for the whole batch; ids are assigned Python-side.
+        db.add_all(questions)
+        db.flush()
 
+        for q in questions:
             # Hook: run real OCR when crop images become available.
             _run_ocr_if_available(db, q)
 
@@ -1,13 +1,34 @@
 """Public ID generation using ULID."""
 
+import os
+import time
 import uuid
 
-from ulid import ULID
+# Crockford base32 alphabet used by the ULID spec (no I, L, O, U).
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+
+def _crockford32(raw: bytes) -> str:
+    """Encode 16 bytes (48-bit timestamp + 80-bit randomness) as a 26-char ULID string."""
+    value = int.from_bytes(raw, "big")
+    return "".join(_ALPHABET[(value >> shift) & 0x1F] for shift in range(125, -1, -5))
 
 
 def new_public_id(prefix: str) -> str:
     """Return a prefixed ULID string, e.g. ``set_01J5K…``."""
-    return f"{prefix}{ULID()}"
+    ts = int(time.time() * 1000).to_bytes(6, "big")
+    return f"{prefix}{_crockford32(ts + os.urandom(10))}"
+
+
+def new_public_ids(prefix: str, count: int) -> list[str]:
+    """Return ``count`` prefixed ULID strings sharing one timestamp read.
+
+    Batch variant for loops that mint many IDs at once (e.g. question
+    generation); pulls all randomness in a single ``os.urandom`` call.
+    """
+    ts = int(time.time() * 1000).to_bytes(6, "big")
+    rand = os.urandom(10 * count)
+    return [f"{prefix}{_crockford32(ts + rand[i * 10 : (i + 1) * 10])}" for i in range(count)]
 
 
 def new_uuid() -> uuid.UUID:
@@ -82,6 +82,8 @@ CREATE TABLE questions (
 
 CREATE INDEX idx_questions_public_id  ON questions (public_id);
 CREATE INDEX idx_questions_set_order  ON questions (set_id, order_index);
+CREATE INDEX idx_questions_metadata_gin ON questions USING GIN (metadata);
+CREATE INDEX idx_questions_meta_difficulty ON questions ((metadata->>'difficulty'));
 
 /* ------------------------------------------------------------------ */
 /*  assets                                                             */
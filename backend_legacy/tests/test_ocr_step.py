@@ -8,6 +8,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from app.pipeline.ocr_step import run_ocr_for_question, _flatten_tokens
+from app.pipeline.ocr_tokens import decode_structure_tokens
 
 
 # ── helpers ──────────────────────────────────────────────────────────
@@ -77,9 +78,10 @@ class TestRunOcrForQuestion:
 
         run_ocr_for_question(db, q, b"fake-image", client=client)
 
-        assert "ocr_tokens" in q.structure
-        assert len(q.structure["ocr_tokens"]) == 2
-        assert q.structure["ocr_tokens"][0]["text"] == "A"
+        assert "ocr_tokens_npy" in q.structure
+        tokens = decode_structure_tokens(q.structure)
+        assert len(tokens) == 2
+        assert tokens[0]["text"] == "A"
 
     def test_confidence_updated(self):
         db = MagicMock()
@@ -144,7 +146,7 @@ class TestRunOcrForQuestion:
         run_ocr_for_question(db, q, b"fake-image", client=client)
 
         assert q.structure["existing_key"] == "value"
-        assert "ocr_tokens" in q.structure
+        assert "ocr_tokens_npy" in q.structure
 
     def test_preserves_existing_metadata_keys(self):
         db = MagicMock()
@@ -169,7 +169,7 @@ class TestFlattenTokens:
         assert tokens[1] == {"text": "나", "bbox": {"x1": 15, "y1": 0, "x2": 25, "y2": 10}, "conf": 0.8}
 
     def test_empty_pages(self):
-        assert _flatten_tokens([]) == []
+        assert len(_flatten_tokens([])) == 0
 
     def test_multiple_blocks_and_paragraphs(self):
         pages = [